@@ -3,26 +3,91 @@
 This module provides:
 - Email analysis using Google Gemini AI
 - Structured JSON output parsing
-- Retry logic for rate limiting
+- Static prompt scaffold carried by the model as a system instruction
+- Retry logic for rate limiting with a shared cooldown and jittered backoff
 - Graceful fallback when AI is unavailable
+- Persistent on-disk cache of analyses keyed by email hash (diskcache)
 - EmailAnalysis dataclass with title, description, priority, due date, key points
 """
 
+import hashlib
 import json
 import logging
+import os
+import random
+import re
+import threading
 import time
-from typing import Optional
+from typing import Any, Optional
 
 from config import (
+    AI_ANALYSIS_CACHE_DIR,
+    AI_ANALYSIS_CACHE_EXPIRE,
     AI_DEFAULT_RETRY_DELAY,
     AI_MAX_RETRIES,
+    AI_MODEL_NAME,
+    BACKOFF_JITTER,
     EmailAnalysis,
     EmailContent,
     EXPONENTIAL_BACKOFF_BASE,
+    MAX_BACKOFF_DELAY,
 )
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from google.api_core import exceptions as gax_exc
+    _RATE_LIMIT_ERRORS: tuple[type[Exception], ...] = (gax_exc.ResourceExhausted,)
+    _TIMEOUT_ERRORS: tuple[type[Exception], ...] = (gax_exc.DeadlineExceeded,)
+except ImportError:
+    # Without google-api-core the Gemini SDK is unavailable, so nothing to match
+    _RATE_LIMIT_ERRORS = ()
+    _TIMEOUT_ERRORS = ()
+
 logger = logging.getLogger("clickup_task_creator")
 
+# Static instruction block shared by every analysis request, supplied to the
+# model as its system instruction so it is not rebuilt per email.
+PROMPT_PREFIX = """Analyze the email provided by the user and extract task information.
+
+Please extract:
+1. A concise task title (5-10 words)
+2. Task description (1-2 sentences summarizing the action needed)
+3. Priority level (Low, Normal, High, or Urgent)
+4. Due date (if mentioned in the email, format as YYYY-MM-DD)
+5. Key action items or points (3-5 bullet points)
+
+Return ONLY valid JSON in this exact format:
+{
+    "title": "Task title here",
+    "description": "Brief description here",
+    "priority": "Normal",
+    "due_date": "2025-01-01",
+    "key_points": ["Point 1", "Point 2", "Point 3"],
+    "confidence": 0.85
+}
+"""
+
+# Precompiled pattern for stripping markdown code fences from responses
+_JSON_FENCE_RE = re.compile(r"^```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+# Shared rate-limit cooldown so concurrent analyses don't retry in lock-step
+_cooldown_until = 0.0
+_cooldown_lock = threading.Lock()
+
+# Lazily imported google.generativeai module and configured models per API key.
+# genai.configure() is process-wide, so the active key is tracked separately.
+_genai: Optional[Any] = None
+_model_cache: dict[str, Any] = {}
+_configured_api_key: Optional[str] = None
+
+# Lazily opened diskcache.Cache of previous analyses (False if unavailable)
+_analysis_cache: Optional[Any] = None
+
 
 class AIAnalysisError(Exception):
     """Raised when AI analysis fails."""
@@ -32,7 +97,8 @@ class AIAnalysisError(Exception):
 def analyze_email(
     email_content: EmailContent,
     gemini_api_key: str,
-    max_retries: int = AI_MAX_RETRIES
+    max_retries: int = AI_MAX_RETRIES,
+    use_analysis_cache: bool = True
 ) -> EmailAnalysis:
     """Analyze email content using Google Gemini AI.
     
@@ -40,6 +106,7 @@ def analyze_email(
         email_content: Email content to analyze
         gemini_api_key: Google Gemini API key
         max_retries: Maximum number of retries for rate limiting
+        use_analysis_cache: Reuse and store analyses in the on-disk cache
     
     Returns:
         Structured email analysis with title, description, priority, etc.
@@ -49,62 +116,222 @@ def analyze_email(
     """
     logger.info("Analyzing email content with Google Gemini AI")
     
-    try:
-        import google.generativeai as genai
-    except ImportError:
+    # Short-circuit when this email was already analyzed
+    cache = _get_analysis_cache() if use_analysis_cache else None
+    if cache is not None:
+        cache_key = _email_cache_key(email_content)
+        cached_analysis = _read_cached_analysis(cache, cache_key)
+        if cached_analysis is not None:
+            logger.info("Using cached email analysis")
+            return cached_analysis
+    
+    genai = _get_genai()
+    if genai is None:
         logger.warning("google-generativeai package not installed, falling back to basic extraction")
         return _basic_email_analysis(email_content)
     
-    # Configure Gemini
-    genai.configure(api_key=gemini_api_key)
-    model = genai.GenerativeModel("gemini-2.5-flash-lite")
+    # Reuse the configured model for this API key
+    model = _get_model(genai, gemini_api_key)
     
-    # Build analysis prompt
+    # Build per-email prompt (the instruction scaffold lives in the model)
     prompt = _build_analysis_prompt(email_content)
     
     # Retry loop for rate limiting
     for attempt in range(max_retries):
         try:
             logger.debug(f"Sending analysis request to Gemini (attempt {attempt + 1}/{max_retries})")
+            _wait_for_cooldown()
             
             response = model.generate_content(prompt)
             
             # Parse JSON response
             analysis = _parse_gemini_response(response.text)
             
-            logger.info("Email analysis completed successfully")
-            return analysis
-            
-        except Exception as e:
-            error_msg = str(e)
-            
+        except _RATE_LIMIT_ERRORS as e:
             # Handle rate limiting (429)
-            if "429" in error_msg or "rate limit" in error_msg.lower():
-                if attempt < max_retries - 1:
-                    # Parse retry delay from error message if available
-                    retry_delay = _parse_retry_delay(error_msg)
-                    logger.warning(f"Rate limit hit, retrying after {retry_delay}s")
-                    time.sleep(retry_delay)
-                    continue
-                else:
-                    logger.error("Rate limit exceeded, max retries reached")
-                    return _basic_email_analysis(email_content)
-            
-            # Other errors
-            logger.error(f"Gemini analysis failed: {e}")
             if attempt < max_retries - 1:
-                time.sleep(EXPONENTIAL_BACKOFF_BASE ** attempt)  # Exponential backoff
+                retry_delay = _parse_retry_delay(e)
+                logger.warning(f"Rate limit hit, retrying after {retry_delay}s")
+                _start_cooldown(retry_delay)
                 continue
-            else:
-                logger.warning("Falling back to basic email analysis")
-                return _basic_email_analysis(email_content)
+            logger.error("Rate limit exceeded, max retries reached")
+            return _basic_email_analysis(email_content)
+        
+        except _TIMEOUT_ERRORS as e:
+            logger.warning(f"Gemini request timed out (attempt {attempt + 1}/{max_retries})")
+            error = e
+        
+        except Exception as e:
+            error = e
+        
+        else:
+            # Storing the result is outside the try so cache failures never retry Gemini
+            if cache is not None:
+                _store_analysis(cache, cache_key, analysis)
+            
+            logger.info("Email analysis completed successfully")
+            return analysis
+        
+        # Other errors
+        logger.error(f"Gemini analysis failed: {error}")
+        if attempt < max_retries - 1:
+            time.sleep(_backoff_delay(attempt))
+            continue
+        logger.warning("Falling back to basic email analysis")
+        return _basic_email_analysis(email_content)
     
     # Fallback if all retries failed
     return _basic_email_analysis(email_content)
 
 
+def _backoff_delay(attempt: int) -> float:
+    """Calculate a capped exponential backoff delay with jitter.
+    
+    Args:
+        attempt: Zero-based retry attempt number
+    
+    Returns:
+        Delay in seconds
+    """
+    delay = EXPONENTIAL_BACKOFF_BASE ** attempt + random.uniform(0, BACKOFF_JITTER)
+    return min(delay, MAX_BACKOFF_DELAY)
+
+
+def _start_cooldown(seconds: float) -> None:
+    """Block new Gemini requests until the rate-limit cooldown has passed.
+    
+    Args:
+        seconds: Cooldown duration in seconds
+    """
+    global _cooldown_until
+    
+    with _cooldown_lock:
+        _cooldown_until = max(_cooldown_until, time.monotonic() + seconds)
+
+
+def _wait_for_cooldown() -> None:
+    """Sleep until any active Gemini rate-limit cooldown has passed."""
+    wait = _cooldown_until - time.monotonic()
+    if wait > 0:
+        logger.debug(f"Gemini rate limit cooldown active, waiting {wait:.1f}s")
+        time.sleep(wait)
+
+
+def _email_cache_key(email_content: EmailContent) -> str:
+    """Build the analysis cache key for an email.
+    
+    Args:
+        email_content: Email content to key
+    
+    Returns:
+        Hex digest of the email subject, sender and body
+    """
+    raw = f"{email_content.subject}\0{email_content.sender}\0{email_content.body}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _get_analysis_cache() -> Optional[Any]:
+    """Open the on-disk analysis cache once.
+    
+    Returns:
+        diskcache.Cache instance or None if diskcache is not installed
+    """
+    global _analysis_cache
+    
+    if _analysis_cache is None:
+        try:
+            from diskcache import Cache
+            
+            _analysis_cache = Cache(os.path.expanduser(AI_ANALYSIS_CACHE_DIR))
+        except ImportError:
+            logger.debug("diskcache not installed, analysis caching disabled")
+            _analysis_cache = False
+        except Exception as e:
+            logger.debug(f"Could not open analysis cache: {e}")
+            _analysis_cache = False
+    return _analysis_cache or None
+
+
+def _read_cached_analysis(cache: Any, cache_key: str) -> Optional[EmailAnalysis]:
+    """Read a previous analysis, treating cache failures as a miss.
+    
+    Args:
+        cache: Open diskcache.Cache instance
+        cache_key: Key from _email_cache_key
+    
+    Returns:
+        Cached analysis or None if absent or unreadable
+    """
+    try:
+        return cache.get(cache_key)
+    except Exception as e:
+        logger.debug(f"Could not read analysis cache: {e}")
+        return None
+
+
+def _store_analysis(cache: Any, cache_key: str, analysis: EmailAnalysis) -> None:
+    """Store an analysis, ignoring cache failures.
+    
+    Args:
+        cache: Open diskcache.Cache instance
+        cache_key: Key from _email_cache_key
+        analysis: Analysis to store
+    """
+    try:
+        cache.set(cache_key, analysis, expire=AI_ANALYSIS_CACHE_EXPIRE)
+    except Exception as e:
+        logger.debug(f"Could not write analysis cache: {e}")
+
+
+def _get_genai() -> Optional[Any]:
+    """Import google.generativeai once and reuse it across calls.
+    
+    Returns:
+        The google.generativeai module or None if not installed
+    """
+    global _genai
+    
+    if _genai is None:
+        try:
+            import google.generativeai as genai
+        except ImportError:
+            return None
+        _genai = genai
+    return _genai
+
+
+def _get_model(genai: Any, api_key: str) -> Any:
+    """Get the configured Gemini model for an API key, creating it once.
+    
+    The static PROMPT_PREFIX is carried by the model as its system
+    instruction, so only the per-email prompt is built for each request.
+    
+    Args:
+        genai: Imported google.generativeai module
+        api_key: Google Gemini API key
+    
+    Returns:
+        Gemini GenerativeModel instance
+    """
+    global _configured_api_key
+    
+    # Requests use the SDK's global key, so switch it whenever the key changes
+    if api_key != _configured_api_key:
+        genai.configure(api_key=api_key)
+        _configured_api_key = api_key
+    
+    model = _model_cache.get(api_key)
+    if model is None:
+        model = genai.GenerativeModel(AI_MODEL_NAME, system_instruction=PROMPT_PREFIX)
+        _model_cache[api_key] = model
+    return model
+
+
 def _build_analysis_prompt(email_content: EmailContent) -> str:
-    """Build analysis prompt for Gemini.
+    """Build the per-email part of the analysis prompt for Gemini.
+    
+    The static instructions live in PROMPT_PREFIX and are supplied through
+    the model, so only the email fields are sent with each request.
     
     Args:
         email_content: Email content to analyze
@@ -112,30 +339,11 @@ def _build_analysis_prompt(email_content: EmailContent) -> str:
     Returns:
         Formatted prompt string
     """
-    prompt = f"""Analyze this email and extract task information.
-
-Email Subject: {email_content.subject}
+    prompt = f"""Email Subject: {email_content.subject}
 Email From: {email_content.sender}
 Email Date: {email_content.date}
 Email Body:
 {email_content.body}
-
-Please extract:
-1. A concise task title (5-10 words)
-2. Task description (1-2 sentences summarizing the action needed)
-3. Priority level (Low, Normal, High, or Urgent)
-4. Due date (if mentioned in the email, format as YYYY-MM-DD)
-5. Key action items or points (3-5 bullet points)
-
-Return ONLY valid JSON in this exact format:
-{{
-    "title": "Task title here",
-    "description": "Brief description here",
-    "priority": "Normal",
-    "due_date": "2025-01-01",
-    "key_points": ["Point 1", "Point 2", "Point 3"],
-    "confidence": 0.85
-}}
 """
     return prompt
 
@@ -155,19 +363,23 @@ def _parse_gemini_response(response_text: str) -> EmailAnalysis:
     try:
         # Extract JSON from response (may have markdown code blocks)
         json_text = response_text.strip()
-        if json_text.startswith("```json"):
-            json_text = json_text.split("```json")[1].split("```")[0].strip()
-        elif json_text.startswith("```"):
-            json_text = json_text.split("```")[1].split("```")[0].strip()
+        fence_match = _JSON_FENCE_RE.match(json_text)
+        if fence_match:
+            json_text = fence_match.group(1)
+        
+        data = _json_loads(json_text)
         
-        data = json.loads(json_text)
+        # Only a JSON array is a list of points; null or other values mean none
+        key_points = data.get("key_points")
+        if not isinstance(key_points, (list, tuple)):
+            key_points = ()
         
         return EmailAnalysis(
             title=data.get("title", "Email Task"),
             description=data.get("description", ""),
             priority=data.get("priority", "Normal"),
             due_date=data.get("due_date"),
-            key_points=data.get("key_points", []),
+            key_points=tuple(key_points),
             confidence=data.get("confidence", 0.0)
         )
     except (json.JSONDecodeError, KeyError) as e:
@@ -175,24 +387,29 @@ def _parse_gemini_response(response_text: str) -> EmailAnalysis:
         raise AIAnalysisError(f"Invalid response format: {e}")
 
 
-def _parse_retry_delay(error_msg: str) -> int:
-    """Parse retry delay from error message.
+def _parse_retry_delay(error: Exception) -> int:
+    """Get the server-suggested retry delay from a rate limit error.
+    
+    Checks the RetryInfo detail attached by the Gemini API, then a
+    Retry-After response header.
     
     Args:
-        error_msg: Error message potentially containing retry delay
+        error: Rate limit exception raised by the Gemini SDK
     
     Returns:
         Retry delay in seconds (default: AI_DEFAULT_RETRY_DELAY)
     """
-    # Try to extract retry delay from error message
-    # Example: "Retry after 30 seconds"
-    import re
+    for detail in getattr(error, "details", None) or ():
+        retry_delay = getattr(detail, "retry_delay", None)
+        if retry_delay is not None and getattr(retry_delay, "seconds", 0):
+            return int(retry_delay.seconds)
     
-    match = re.search(r"retry.*?(\d+)", error_msg, re.IGNORECASE)
-    if match:
-        return int(match.group(1))
+    response = getattr(error, "response", None)
+    retry_after = getattr(response, "headers", {}).get("Retry-After")
+    if retry_after and str(retry_after).isdigit():
+        return int(retry_after)
     
-    return AI_DEFAULT_RETRY_DELAY  # Default retry delay
+    return AI_DEFAULT_RETRY_DELAY
 
 
 def _basic_email_analysis(email_content: EmailContent) -> EmailAnalysis:
@@ -210,7 +427,7 @@ def _basic_email_analysis(email_content: EmailContent) -> EmailAnalysis:
     title = email_content.subject[:100] if email_content.subject else "Email Task"
     
     # Use first few lines of body as description
-    description_lines = email_content.body.split("\n")[:3]
+    description_lines = email_content.body.split("\n", 3)[:3]
     description = " ".join(line.strip() for line in description_lines if line.strip())
     if len(description) > 200:
         description = description[:197] + "..."
@@ -220,6 +437,6 @@ def _basic_email_analysis(email_content: EmailContent) -> EmailAnalysis:
         description=description,
         priority="Normal",
         due_date=None,
-        key_points=[],
+        key_points=(),
         confidence=0.5
     )
@@ -3,29 +3,60 @@
 This module provides an enhanced API client with:
 - GET, POST, PUT request support
 - Custom field schema retrieval
-- List and space discovery
-- Error handling and retry logic
-- Rate limit handling
+- List and space discovery (with parallel bulk variants)
+- Error handling with transport-level retries (urllib3 Retry)
+- Rate limit handling honoring Retry-After, plus a shared cooldown
 - 30-second timeout for all requests
+- Keep-alive connection pooling with one shared client per API key
 """
 
+import json
 import logging
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
-from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import TimeoutError as Urllib3TimeoutError
+from urllib3.util.retry import Retry
 
 from config import (
+    API_ENDPOINT_FIELDS,
+    API_ENDPOINT_LISTS,
+    API_ENDPOINT_SPACES,
+    API_ENDPOINT_TASKS,
+    API_ENDPOINT_TEAMS,
     API_TIMEOUT,
+    BACKOFF_JITTER,
     CLICKUP_API_BASE_URL,
     DEFAULT_RETRY_AFTER,
+    DISCOVERY_MAX_WORKERS,
     EXPONENTIAL_BACKOFF_BASE,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    MAX_BACKOFF_DELAY,
     MAX_RETRIES,
+    POST_RETRY_STATUS_CODES,
+    RETRY_STATUS_CODES,
 )
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 logger = logging.getLogger("clickup_task_creator")
 
+# Shared rate-limit cooldown so concurrent callers don't retry in lock-step
+_cooldown_until = 0.0
+_cooldown_lock = threading.Lock()
+
 
 class APIError(Exception):
     """Base exception for API errors."""
@@ -37,6 +68,116 @@ class RateLimitError(APIError):
     pass
 
 
+class _ClickUpRetry(Retry):
+    """Retry policy that only resends a POST the server explicitly refused.
+    
+    POST is not in allowed_methods, so read errors and timeouts on a POST
+    (which may already have created a task) are never retried. Responses
+    in POST_RETRY_STATUS_CODES mean the request was not processed, so
+    those are resent like any other method.
+    """
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        """Check whether a response should be retried.
+        
+        Args:
+            method: HTTP method of the request
+            status_code: Response status code
+            has_retry_after: Whether the response carries a Retry-After header
+        
+        Returns:
+            True if the request should be retried
+        """
+        if method == "POST":
+            return status_code in POST_RETRY_STATUS_CODES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Calculate a capped exponential backoff delay with jitter.
+    
+    Args:
+        attempt: Zero-based retry attempt number
+    
+    Returns:
+        Delay in seconds
+    """
+    delay = EXPONENTIAL_BACKOFF_BASE ** attempt + random.uniform(0, BACKOFF_JITTER)
+    return min(delay, MAX_BACKOFF_DELAY)
+
+
+def _start_cooldown(seconds: float) -> None:
+    """Block new requests until the rate-limit cooldown has passed.
+    
+    Args:
+        seconds: Cooldown duration in seconds
+    """
+    global _cooldown_until
+    
+    with _cooldown_lock:
+        _cooldown_until = max(_cooldown_until, time.monotonic() + seconds)
+
+
+def _wait_for_cooldown() -> None:
+    """Sleep until any active rate-limit cooldown has passed."""
+    wait = _cooldown_until - time.monotonic()
+    if wait > 0:
+        logger.debug(f"Rate limit cooldown active, waiting {wait:.1f}s")
+        time.sleep(wait)
+
+
+def _is_timeout(error: requests.exceptions.RequestException) -> bool:
+    """Check whether a request failed because of a timeout.
+    
+    Once the adapter's retries are exhausted, read timeouts surface as a
+    ConnectionError wrapping urllib3's MaxRetryError rather than Timeout.
+    
+    Args:
+        error: Exception raised by the session
+    
+    Returns:
+        True if the request timed out
+    """
+    if isinstance(error, requests.exceptions.Timeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, Urllib3TimeoutError)
+
+
+def _project(item: dict, keys: tuple[str, ...]) -> dict:
+    """Keep only the given keys of a response item.
+    
+    Args:
+        item: Response item dictionary
+        keys: Keys to keep
+    
+    Returns:
+        Dictionary with the selected keys present in item
+    """
+    return {key: item[key] for key in keys if key in item}
+
+
+def _find_by_name(items: list[dict], name: str, kind: str) -> dict:
+    """Find a workspace, space or list by name (case-insensitive).
+    
+    Args:
+        items: Response items with a "name" key
+        name: Name to look for
+        kind: Item kind used in the error message
+    
+    Returns:
+        Matching item
+    
+    Raises:
+        APIError: If no item has the given name
+    """
+    wanted = name.casefold()
+    for item in items:
+        if item.get("name", "").casefold() == wanted:
+            return item
+    raise APIError(f"{kind} not found: {name}")
+
+
 class ClickUpAPIClient:
     """Client for interacting with ClickUp API v2.
     
@@ -53,28 +194,58 @@ class ClickUpAPIClient:
         """
         self.api_key = api_key
         self.base_url = base_url
+        self._base = base_url.rstrip("/")
         self.session = requests.Session()
         self.session.headers.update({
             "Authorization": api_key,
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+            "Accept-Encoding": "gzip, deflate"
         })
+        
+        # Transport-level retries for rate limits and server errors; POST is only
+        # resent when the server refused it, never after a read error
+        retry = _ClickUpRetry(
+            total=MAX_RETRIES,
+            backoff_factor=1,
+            backoff_max=MAX_BACKOFF_DELAY,
+            backoff_jitter=BACKOFF_JITTER,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "PUT"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        
+        # Pooled keep-alive connections so the discovery chain reuses one TLS session
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            pool_block=False,
+            max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+        
+        # Caps in-flight requests so parallel discovery cannot amplify 429s
+        self._request_semaphore = threading.Semaphore(DISCOVERY_MAX_WORKERS)
+        
+        # Discovery results reused for every task created with this client
+        self._list_id_cache: dict[tuple[str, str, str], str] = {}
+        self._custom_fields_cache: dict[str, list[dict]] = {}
     
     def _request(
         self,
         method: str,
         endpoint: str,
         data: Optional[dict] = None,
-        params: Optional[dict] = None,
-        retries: int = MAX_RETRIES
+        params: Optional[dict] = None
     ) -> Any:
-        """Make HTTP request with retry logic.
+        """Make HTTP request; transient failures are retried by the session adapter.
         
         Args:
             method: HTTP method (GET, POST, PUT)
             endpoint: API endpoint path
             data: Request body data
             params: Query parameters
-            retries: Number of retries for transient failures
         
         Returns:
             Response JSON data
@@ -83,50 +254,51 @@ class ClickUpAPIClient:
             APIError: On API errors
             RateLimitError: On rate limit exceeded
         """
-        url = urljoin(self.base_url, endpoint)
+        # Endpoints always start with "/", so plain concatenation keeps the /api/v2 prefix
+        url = self._base + endpoint
+        body = _json_dumps(data) if data is not None else None
         
-        for attempt in range(retries):
-            try:
-                logger.debug(f"{method} {url} (attempt {attempt + 1}/{retries})")
-                
+        logger.debug(f"{method} {url}")
+        _wait_for_cooldown()
+        
+        # 429/5xx retries, Retry-After and backoff are handled by the mounted adapter
+        try:
+            with self._request_semaphore:
                 response = self.session.request(
                     method=method,
                     url=url,
-                    json=data,
+                    data=body,
                     params=params,
                     timeout=API_TIMEOUT
                 )
-                
-                # Handle rate limiting
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", DEFAULT_RETRY_AFTER))
-                    logger.warning(f"Rate limit exceeded, retrying after {retry_after}s")
-                    
-                    if attempt < retries - 1:
-                        time.sleep(retry_after)
-                        continue
-                    raise RateLimitError(f"Rate limit exceeded: {response.text}")
-                
-                # Handle other errors
-                response.raise_for_status()
-                
-                return response.json() if response.content else {}
-                
-            except requests.exceptions.Timeout:
-                logger.warning(f"Request timeout (attempt {attempt + 1}/{retries})")
-                if attempt < retries - 1:
-                    time.sleep(EXPONENTIAL_BACKOFF_BASE ** attempt)  # Exponential backoff
-                    continue
-                raise APIError(f"Request timeout after {retries} attempts")
-            
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request failed: {e}")
-                if attempt < retries - 1 and response.status_code >= 500:
-                    time.sleep(EXPONENTIAL_BACKOFF_BASE ** attempt)
-                    continue
-                raise APIError(f"API request failed: {e}")
-        
-        raise APIError(f"Request failed after {retries} attempts")
+        except requests.exceptions.RequestException as e:
+            if _is_timeout(e):
+                logger.warning(f"Request timeout: {e}")
+                raise APIError(f"API request timed out: {e}")
+            logger.error(f"Request failed: {e}")
+            raise APIError(f"API request failed: {e}")
+        
+        # Rate limit still exceeded once the adapter's retries are exhausted
+        if response.status_code == 429:
+            retry_after = int(response.headers.get("Retry-After", DEFAULT_RETRY_AFTER))
+            logger.error(f"Rate limit exceeded, cooling down for {retry_after}s")
+            _start_cooldown(retry_after)
+            raise RateLimitError(f"Rate limit exceeded: {response.text}")
+        
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            logger.error(f"Request failed: {e}")
+            raise APIError(f"API request failed: {e}")
+        
+        if not response.content:
+            return {}
+        # orjson and json decode errors are both ValueError subclasses
+        try:
+            return _json_loads(response.content)
+        except ValueError as e:
+            logger.error(f"Invalid JSON response: {e}")
+            raise APIError(f"Invalid JSON response: {e}")
     
     def get(self, endpoint: str, params: Optional[dict] = None) -> Any:
         """Make GET request to ClickUp API.
@@ -170,7 +342,7 @@ class ClickUpAPIClient:
         Returns:
             List of workspace dictionaries
         """
-        response = self.get("/team")
+        response = self.get(API_ENDPOINT_TEAMS)
         return response.get("teams", [])
     
     def get_spaces(self, team_id: str) -> list[dict]:
@@ -182,7 +354,7 @@ class ClickUpAPIClient:
         Returns:
             List of space dictionaries
         """
-        response = self.get(f"/team/{team_id}/space")
+        response = self.get(API_ENDPOINT_SPACES.format(team_id=team_id))
         return response.get("spaces", [])
     
     def get_lists(self, space_id: str) -> list[dict]:
@@ -194,11 +366,11 @@ class ClickUpAPIClient:
         Returns:
             List of list dictionaries
         """
-        response = self.get(f"/space/{space_id}/list")
+        response = self.get(API_ENDPOINT_LISTS.format(space_id=space_id))
         return response.get("lists", [])
     
     def get_custom_fields(self, list_id: str) -> list[dict]:
-        """Get custom field schema for a list.
+        """Get custom field schema for a list (cached per list).
         
         Args:
             list_id: List ID
@@ -206,8 +378,120 @@ class ClickUpAPIClient:
         Returns:
             List of custom field definitions
         """
-        response = self.get(f"/list/{list_id}/field")
-        return response.get("fields", [])
+        fields = self._custom_fields_cache.get(list_id)
+        if fields is None:
+            response = self.get(API_ENDPOINT_FIELDS.format(list_id=list_id))
+            fields = response.get("fields", [])
+            self._custom_fields_cache[list_id] = fields
+        return fields
+    
+    def get_custom_fields_lean(
+        self,
+        list_id: str,
+        *,
+        keys: tuple[str, ...] = ("id", "name", "type")
+    ) -> list[dict]:
+        """Get custom field schema for a list, keeping only selected keys.
+        
+        Streams the response through ijson (when installed) so only one
+        field definition is materialized at a time. Lists already fetched by
+        get_custom_fields are projected from the cache, and the full
+        response is used when ijson is unavailable.
+        
+        Args:
+            list_id: List ID
+            keys: Field definition keys to keep
+        
+        Returns:
+            List of projected custom field definitions
+        
+        Raises:
+            APIError: On API errors or a malformed response
+            RateLimitError: On rate limit exceeded
+        """
+        fields = self._custom_fields_cache.get(list_id)
+        if fields is not None:
+            return [_project(field, keys) for field in fields]
+        
+        try:
+            import ijson
+        except ImportError:
+            logger.debug("ijson not installed, projecting full custom field response")
+            return [_project(field, keys) for field in self.get_custom_fields(list_id)]
+        
+        url = self._base + API_ENDPOINT_FIELDS.format(list_id=list_id)
+        _wait_for_cooldown()
+        
+        # 429/5xx retries are handled by the mounted adapter, as in _request
+        try:
+            with self._request_semaphore:
+                with self.session.get(url, stream=True, timeout=API_TIMEOUT) as response:
+                    if response.status_code == 429:
+                        retry_after = int(response.headers.get("Retry-After", DEFAULT_RETRY_AFTER))
+                        logger.error(f"Rate limit exceeded, cooling down for {retry_after}s")
+                        _start_cooldown(retry_after)
+                        raise RateLimitError("Rate limit exceeded")
+                    response.raise_for_status()
+                    
+                    response.raw.decode_content = True
+                    return [
+                        _project(field, keys)
+                        for field in ijson.items(response.raw, "fields.item")
+                    ]
+        except (requests.exceptions.RequestException, ijson.JSONError) as e:
+            logger.error(f"Request failed: {e}")
+            raise APIError(f"API request failed: {e}")
+    
+    def get_lists_bulk(self, space_ids: list[str]) -> dict[str, list[dict]]:
+        """Get lists for several spaces concurrently.
+        
+        Args:
+            space_ids: Space IDs to query
+        
+        Returns:
+            Mapping of space ID to its list dictionaries
+        """
+        with ThreadPoolExecutor(max_workers=DISCOVERY_MAX_WORKERS) as executor:
+            return dict(zip(space_ids, executor.map(self.get_lists, space_ids)))
+    
+    def get_custom_fields_bulk(self, list_ids: list[str]) -> dict[str, list[dict]]:
+        """Get custom field schemas for several lists concurrently.
+        
+        Args:
+            list_ids: List IDs to query
+        
+        Returns:
+            Mapping of list ID to its custom field definitions
+        """
+        with ThreadPoolExecutor(max_workers=DISCOVERY_MAX_WORKERS) as executor:
+            return dict(zip(list_ids, executor.map(self.get_custom_fields, list_ids)))
+    
+    def resolve_list_id(self, workspace_name: str, space_name: str, list_name: str) -> str:
+        """Resolve a list ID from workspace, space and list names.
+        
+        The workspace → space → list walk runs once per name triple;
+        later calls return the cached ID without any requests.
+        
+        Args:
+            workspace_name: Workspace (team) name
+            space_name: Space name
+            list_name: List name
+        
+        Returns:
+            List ID
+        
+        Raises:
+            APIError: If a workspace, space or list cannot be found
+        """
+        key = (workspace_name, space_name, list_name)
+        list_id = self._list_id_cache.get(key)
+        if list_id is None:
+            workspace = _find_by_name(self.get_workspaces(), workspace_name, "Workspace")
+            space = _find_by_name(self.get_spaces(workspace["id"]), space_name, "Space")
+            task_list = _find_by_name(self.get_lists(space["id"]), list_name, "List")
+            list_id = str(task_list["id"])
+            self._list_id_cache[key] = list_id
+        return list_id
     
     def create_task(self, list_id: str, task_data: dict) -> dict:
         """Create a new task in a list.
@@ -219,4 +503,26 @@ class ClickUpAPIClient:
         Returns:
             Created task data including ID and URL
         """
-        return self.post(f"/list/{list_id}/task", task_data)
+        return self.post(API_ENDPOINT_TASKS.format(list_id=list_id), task_data)
+
+
+_CLIENTS: dict[str, ClickUpAPIClient] = {}
+
+
+def get_client(api_key: str) -> ClickUpAPIClient:
+    """Get the shared ClickUp API client for an API key.
+    
+    Clients are cached for the lifetime of the process so their
+    session and connection pool are reused across task creations.
+    
+    Args:
+        api_key: ClickUp API authentication token
+    
+    Returns:
+        Cached ClickUp API client instance
+    """
+    client = _CLIENTS.get(api_key)
+    if client is None:
+        client = ClickUpAPIClient(api_key)
+        _CLIENTS[api_key] = client
+    return client
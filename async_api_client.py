@@ -0,0 +1,306 @@
+"""Asynchronous ClickUp API client for concurrent discovery.
+
+This module provides an httpx-based counterpart to ClickUpAPIClient with:
+- Async GET, POST, PUT request support
+- HTTP/2 stream multiplexing when the h2 package is installed
+- Concurrent list and custom field discovery via asyncio.gather
+- Error handling, jittered backoff and rate limit handling
+- One shared client per event loop and API key
+"""
+
+import asyncio
+import importlib.util
+import logging
+import time
+import weakref
+from typing import Any, Optional
+
+import httpx
+
+from api_client import APIError, RateLimitError, _backoff_delay, _json_loads
+from config import (
+    API_ENDPOINT_FIELDS,
+    API_ENDPOINT_LISTS,
+    API_ENDPOINT_SPACES,
+    API_ENDPOINT_TASKS,
+    API_ENDPOINT_TEAMS,
+    API_TIMEOUT,
+    CLICKUP_API_BASE_URL,
+    DEFAULT_RETRY_AFTER,
+    DISCOVERY_MAX_WORKERS,
+    HTTP_POOL_MAXSIZE,
+    MAX_RETRIES,
+)
+
+logger = logging.getLogger("clickup_task_creator")
+
+# HTTP/2 needs the optional h2 package; fall back to pooled HTTP/1.1 without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class AsyncClickUpAPIClient:
+    """Async client for interacting with ClickUp API v2.
+    
+    Mirrors ClickUpAPIClient, but issues requests on a single httpx
+    connection pool so discovery calls can run concurrently.
+    """
+    
+    def __init__(self, api_key: str, base_url: str = CLICKUP_API_BASE_URL):
+        """Initialize async ClickUp API client.
+        
+        Args:
+            api_key: ClickUp API authentication token
+            base_url: Base URL for ClickUp API (default: v2 endpoint)
+        """
+        self.api_key = api_key
+        self.base_url = base_url
+        self.client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            http2=HTTP2_AVAILABLE,
+            timeout=API_TIMEOUT,
+            limits=httpx.Limits(max_connections=HTTP_POOL_MAXSIZE),
+            headers={
+                "Authorization": api_key,
+                "Content-Type": "application/json",
+                "Accept-Encoding": "gzip, deflate"
+            }
+        )
+        self._cooldown_until = 0.0
+        self._request_semaphore = asyncio.Semaphore(DISCOVERY_MAX_WORKERS)
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[dict] = None,
+        params: Optional[dict] = None,
+        retries: int = MAX_RETRIES
+    ) -> Any:
+        """Make HTTP request with retry logic.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT)
+            endpoint: API endpoint path
+            data: Request body data
+            params: Query parameters
+            retries: Number of retries for transient failures
+        
+        Returns:
+            Response JSON data
+        
+        Raises:
+            APIError: On API errors
+            RateLimitError: On rate limit exceeded
+        """
+        for attempt in range(retries):
+            logger.debug(f"{method} {endpoint} (attempt {attempt + 1}/{retries})")
+            
+            wait = self._cooldown_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            
+            try:
+                async with self._request_semaphore:
+                    response = await self.client.request(
+                        method,
+                        endpoint,
+                        json=data,
+                        params=params
+                    )
+            except httpx.TimeoutException:
+                logger.warning(f"Request timeout (attempt {attempt + 1}/{retries})")
+                if attempt < retries - 1:
+                    await asyncio.sleep(_backoff_delay(attempt))
+                    continue
+                raise APIError(f"Request timeout after {retries} attempts")
+            except httpx.HTTPError as e:
+                logger.error(f"Request failed: {e}")
+                raise APIError(f"API request failed: {e}")
+            
+            # Handle rate limiting
+            if response.status_code == 429:
+                retry_after = int(response.headers.get("Retry-After", DEFAULT_RETRY_AFTER))
+                logger.warning(f"Rate limit exceeded, retrying after {retry_after}s")
+                self._cooldown_until = max(self._cooldown_until, time.monotonic() + retry_after)
+                
+                if attempt < retries - 1:
+                    continue
+                raise RateLimitError(f"Rate limit exceeded: {response.text}")
+            
+            # Retry server errors, fail fast on client errors
+            if response.status_code >= 500 and attempt < retries - 1:
+                logger.warning(f"Server error {response.status_code}, retrying")
+                await asyncio.sleep(_backoff_delay(attempt))
+                continue
+            
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                logger.error(f"Request failed: {e}")
+                raise APIError(f"API request failed: {e}")
+            
+            if not response.content:
+                return {}
+            # orjson and json decode errors are both ValueError subclasses
+            try:
+                return _json_loads(response.content)
+            except ValueError as e:
+                logger.error(f"Invalid JSON response: {e}")
+                raise APIError(f"Invalid JSON response: {e}")
+        
+        raise APIError(f"Request failed after {retries} attempts")
+    
+    async def get(self, endpoint: str, params: Optional[dict] = None) -> Any:
+        """Make GET request to ClickUp API.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+        
+        Returns:
+            Response JSON data
+        """
+        return await self._request("GET", endpoint, params=params)
+    
+    async def post(self, endpoint: str, data: dict) -> Any:
+        """Make POST request to ClickUp API.
+        
+        Args:
+            endpoint: API endpoint path
+            data: Request body data
+        
+        Returns:
+            Response JSON data
+        """
+        return await self._request("POST", endpoint, data=data)
+    
+    async def put(self, endpoint: str, data: dict) -> Any:
+        """Make PUT request to ClickUp API.
+        
+        Args:
+            endpoint: API endpoint path
+            data: Request body data
+        
+        Returns:
+            Response JSON data
+        """
+        return await self._request("PUT", endpoint, data=data)
+    
+    async def get_workspaces(self) -> list[dict]:
+        """Get all workspaces (teams) for the authenticated user.
+        
+        Returns:
+            List of workspace dictionaries
+        """
+        response = await self.get(API_ENDPOINT_TEAMS)
+        return response.get("teams", [])
+    
+    async def get_spaces(self, team_id: str) -> list[dict]:
+        """Get all spaces in a workspace.
+        
+        Args:
+            team_id: Workspace/team ID
+        
+        Returns:
+            List of space dictionaries
+        """
+        response = await self.get(API_ENDPOINT_SPACES.format(team_id=team_id))
+        return response.get("spaces", [])
+    
+    async def get_lists(self, space_id: str) -> list[dict]:
+        """Get all lists in a space.
+        
+        Args:
+            space_id: Space ID
+        
+        Returns:
+            List of list dictionaries
+        """
+        response = await self.get(API_ENDPOINT_LISTS.format(space_id=space_id))
+        return response.get("lists", [])
+    
+    async def get_custom_fields(self, list_id: str) -> list[dict]:
+        """Get custom field schema for a list.
+        
+        Args:
+            list_id: List ID
+        
+        Returns:
+            List of custom field definitions
+        """
+        response = await self.get(API_ENDPOINT_FIELDS.format(list_id=list_id))
+        return response.get("fields", [])
+    
+    async def get_lists_bulk(self, space_ids: list[str]) -> dict[str, list[dict]]:
+        """Get lists for several spaces concurrently.
+        
+        Args:
+            space_ids: Space IDs to query
+        
+        Returns:
+            Mapping of space ID to its list dictionaries
+        """
+        results = await asyncio.gather(*(self.get_lists(space_id) for space_id in space_ids))
+        return dict(zip(space_ids, results))
+    
+    async def get_custom_fields_bulk(self, list_ids: list[str]) -> dict[str, list[dict]]:
+        """Get custom field schemas for several lists concurrently.
+        
+        Args:
+            list_ids: List IDs to query
+        
+        Returns:
+            Mapping of list ID to its custom field definitions
+        """
+        results = await asyncio.gather(*(self.get_custom_fields(list_id) for list_id in list_ids))
+        return dict(zip(list_ids, results))
+    
+    async def create_task(self, list_id: str, task_data: dict) -> dict:
+        """Create a new task in a list.
+        
+        Args:
+            list_id: Target list ID
+            task_data: Task payload with name, description, custom fields, etc.
+        
+        Returns:
+            Created task data including ID and URL
+        """
+        return await self.post(API_ENDPOINT_TASKS.format(list_id=list_id), task_data)
+    
+    async def aclose(self) -> None:
+        """Close the underlying connection pool.
+        
+        A closed shared client is evicted so get_async_client creates a
+        fresh one on the next call.
+        """
+        loop_clients = _CLIENTS.get(asyncio.get_running_loop())
+        if loop_clients and loop_clients.get(self.api_key) is self:
+            del loop_clients[self.api_key]
+        await self.client.aclose()
+
+
+# Shared clients keyed by event loop, then by API key
+_CLIENTS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_async_client(api_key: str) -> AsyncClickUpAPIClient:
+    """Get the shared async ClickUp API client for the running event loop.
+    
+    httpx connections are bound to the loop that opened them, so clients
+    are cached per event loop and API key.
+    
+    Args:
+        api_key: ClickUp API authentication token
+    
+    Returns:
+        Cached async ClickUp API client instance
+    
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop_clients = _CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    client = loop_clients.get(api_key)
+    if client is None:
+        client = AsyncClickUpAPIClient(api_key)
+        loop_clients[api_key] = client
+    return client
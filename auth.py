@@ -7,90 +7,196 @@ This module handles API key retrieval with multiple fallback mechanisms:
 4. 1Password CLI
 5. Manual prompt
 
-Supports both ClickUp and Google Gemini API keys.
+Supports both ClickUp and Google Gemini API keys. Secrets resolved through
+1Password are cached for the lifetime of the process.
 """
 
+import functools
+import getpass
 import os
+import re
 import subprocess
+import sys
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 
-from rich.console import Console
-from rich.prompt import Prompt
-
-console = Console()
 logger = logging.getLogger("clickup_task_creator")
 
+# Secrets already resolved through 1Password, keyed by reference path
+_SECRET_CACHE: dict[str, str] = {}
 
-def load_secret_with_fallback(
-    cli_value: Optional[str],
-    env_var_name: str,
-    onepassword_ref: str,
-    secret_name: str,
-    required: bool = True
-) -> Optional[str]:
-    """Load a secret with multiple fallback mechanisms.
+# Set once the 1Password SDK resolves a secret; the CLI is skipped afterwards
+_SDK_WORKS = False
+
+# Session export printed by `op signin`, e.g. export OP_SESSION_abc="token"
+_OP_SESSION_RE = re.compile(r'(OP_SESSION_\w+)="?([^"\s]+)"?')
+
+
+@functools.lru_cache(maxsize=1)
+def _get_op_client():
+    """Import and construct the 1Password SDK client once.
+    
+    Returns:
+        1Password SDK client instance
+    
+    Raises:
+        ImportError: If the 1Password SDK is not installed
+    """
+    from onepassword import Client
+    
+    return Client()
+
+
+def _read_onepassword_sdk(onepassword_ref: str) -> Optional[str]:
+    """Resolve a secret through the 1Password SDK.
     
     Args:
-        cli_value: Value from CLI argument (highest priority)
-        env_var_name: Environment variable name to check
         onepassword_ref: 1Password reference path
-        secret_name: Human-readable name for prompts
-        required: Whether the secret is required
     
     Returns:
-        The secret value or None if not required and not found
-    
-    Raises:
-        ValueError: If secret is required but not found
+        The secret value or None if unavailable
     """
-    # Priority 1: CLI argument
-    if cli_value:
-        logger.debug(f"{secret_name} loaded from CLI argument")
-        return cli_value
-    
-    # Priority 2: Environment variable
-    env_value = os.getenv(env_var_name)
-    if env_value:
-        logger.debug(f"{secret_name} loaded from environment variable {env_var_name}")
-        return env_value
-    
-    # Priority 3: 1Password SDK
+    global _SDK_WORKS
+    
+    if not os.getenv("OP_SERVICE_ACCOUNT_TOKEN"):
+        return None
+    
     try:
-        from onepassword import Client
-        
-        service_account_token = os.getenv("OP_SERVICE_ACCOUNT_TOKEN")
-        if service_account_token:
-            client = Client()
-            secret = client.secrets.resolve(onepassword_ref)
-            if secret:
-                logger.debug(f"{secret_name} loaded from 1Password SDK")
-                return secret
+        secret = _get_op_client().secrets.resolve(onepassword_ref)
     except ImportError:
         logger.debug("1Password SDK not available")
+        return None
     except Exception as e:
         logger.debug(f"1Password SDK failed: {e}")
+        return None
     
-    # Priority 4: 1Password CLI
+    if secret:
+        _SDK_WORKS = True
+        _SECRET_CACHE[onepassword_ref] = secret
+    return secret
+
+
+@functools.lru_cache(maxsize=1)
+def _op_session() -> dict[str, str]:
+    """Sign in to the 1Password CLI once and reuse the session.
+    
+    The session is returned as environment variables rather than a CLI
+    argument so the token never appears in the process list.
+    
+    Returns:
+        Mapping of OP_SESSION_<account> to the session token, or an empty
+        dict if no explicit session is needed or sign-in failed (e.g.
+        desktop app integration or a missing CLI)
+    """
     try:
         result = subprocess.run(
-            ["op", "read", onepassword_ref],
+            ["op", "signin"],
             capture_output=True,
             text=True,
             timeout=10
         )
-        if result.returncode == 0 and result.stdout.strip():
-            logger.debug(f"{secret_name} loaded from 1Password CLI")
-            return result.stdout.strip()
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.debug(f"1Password CLI sign-in failed: {e}")
+        return {}
+    
+    if result.returncode != 0:
+        return {}
+    return dict(_OP_SESSION_RE.findall(result.stdout))
+
+
+def _read_onepassword_cli(onepassword_ref: str) -> Optional[str]:
+    """Resolve a secret through the 1Password CLI.
+    
+    Args:
+        onepassword_ref: 1Password reference path
+    
+    Returns:
+        The secret value or None if unavailable
+    """
+    if _SDK_WORKS:
+        return None
+    
+    try:
+        result = subprocess.run(
+            ["op", "read", onepassword_ref],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            env={**os.environ, **_op_session()}
+        )
     except FileNotFoundError:
         logger.debug("1Password CLI not available")
+        return None
     except Exception as e:
         logger.debug(f"1Password CLI failed: {e}")
+        return None
+    
+    secret = result.stdout.strip()
+    if result.returncode == 0 and secret:
+        _SECRET_CACHE[onepassword_ref] = secret
+        return secret
+    return None
+
+
+def _iter_secret_sources(
+    cli_value: Optional[str],
+    env_var_name: str,
+    onepassword_ref: str
+) -> Iterator[tuple[str, Optional[str]]]:
+    """Yield candidate secret values in priority order.
+    
+    Sources are evaluated lazily, so slower lookups only run when every
+    earlier source came up empty.
+    
+    Args:
+        cli_value: Value from CLI argument
+        env_var_name: Environment variable name to check
+        onepassword_ref: 1Password reference path
+    
+    Yields:
+        Tuples of (source description, value or None)
+    """
+    yield "CLI argument", cli_value
+    yield f"environment variable {env_var_name}", os.getenv(env_var_name)
+    yield "1Password cache", _SECRET_CACHE.get(onepassword_ref)
+    yield "1Password SDK", _read_onepassword_sdk(onepassword_ref)
+    yield "1Password CLI", _read_onepassword_cli(onepassword_ref)
+
+
+def load_secret_with_fallback(
+    cli_value: Optional[str],
+    env_var_name: str,
+    onepassword_ref: str,
+    secret_name: str,
+    required: bool = True
+) -> Optional[str]:
+    """Load a secret with multiple fallback mechanisms.
+    
+    Args:
+        cli_value: Value from CLI argument (highest priority)
+        env_var_name: Environment variable name to check
+        onepassword_ref: 1Password reference path
+        secret_name: Human-readable name for prompts
+        required: Whether the secret is required
+    
+    Returns:
+        The secret value or None if not required and not found
+    
+    Raises:
+        ValueError: If secret is required but not found
+    """
+    # Priorities 1-4: CLI argument, environment, 1Password SDK, 1Password CLI
+    for source, value in _iter_secret_sources(cli_value, env_var_name, onepassword_ref):
+        if value:
+            logger.debug(f"{secret_name} loaded from {source}")
+            return value
     
     # Priority 5: Manual prompt
     if required:
-        console.print(f"[yellow]⚠ {secret_name} not found in CLI, environment, or 1Password[/yellow]")
-        value = Prompt.ask(f"Please enter {secret_name}", password=True)
+        sys.stderr.write(f"⚠ {secret_name} not found in CLI, environment, or 1Password\n")
+        value = getpass.getpass(f"Please enter {secret_name}: ")
         if value:
             return value
         raise ValueError(f"{secret_name} is required but not provided")
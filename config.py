@@ -32,7 +32,7 @@ class CustomFieldType(str, Enum):
     NUMBER = "NUMBER"
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailContent:
     """Structured email content extracted from email URL."""
     
@@ -45,15 +45,15 @@ class EmailContent:
     raw_html: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmailAnalysis:
-    """AI-generated analysis of email content."""
+    """AI-generated analysis of email content (immutable)."""
     
     title: str
     description: str
     priority: str
     due_date: Optional[str] = None
-    key_points: list[str] = field(default_factory=list)
+    key_points: tuple[str, ...] = ()
     confidence: float = 0.0
 
 
@@ -68,6 +68,7 @@ class ClickUpTaskConfig:
     gemini_api_key: Optional[str] = None
     custom_field_mappings: dict = field(default_factory=dict)
     enable_ai_summary: bool = False
+    use_analysis_cache: bool = True
     email_platform: EmailPlatform = EmailPlatform.GMAIL
     interactive: bool = False
 
@@ -88,10 +89,26 @@ API_TIMEOUT = 30  # seconds
 MAX_RETRIES = 3  # Maximum number of retry attempts
 DEFAULT_RETRY_AFTER = 60  # Default retry delay in seconds for rate limiting
 EXPONENTIAL_BACKOFF_BASE = 2  # Base for exponential backoff calculation
+MAX_BACKOFF_DELAY = 30  # Upper bound for a single backoff delay in seconds
+BACKOFF_JITTER = 1.0  # Maximum random jitter added to each backoff delay
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)  # HTTP statuses retried automatically
+POST_RETRY_STATUS_CODES = (429, 503)  # Statuses where a POST was rejected unprocessed and is safe to resend
+
+# HTTP Connection Pool Constants
+HTTP_POOL_CONNECTIONS = 4  # Number of host pools to cache
+HTTP_POOL_MAXSIZE = 32  # Maximum keep-alive connections per host
+DISCOVERY_MAX_WORKERS = 8  # Parallel requests for bulk discovery (<= HTTP_POOL_MAXSIZE)
 
 # AI Configuration
 AI_MAX_RETRIES = 3  # Maximum retries for AI API calls
 AI_DEFAULT_RETRY_DELAY = 60  # Default retry delay for AI rate limiting
+AI_MODEL_NAME = "gemini-2.5-flash-lite"  # Gemini model used for email analysis
+AI_ANALYSIS_CACHE_DIR = "~/.cache/clickup_task_creator"  # On-disk cache of email analyses
+AI_ANALYSIS_CACHE_EXPIRE = 7 * 24 * 3600  # Cached analysis lifetime in seconds
+
+# Task Payload Constants
+TASK_DESCRIPTION_MAX_LENGTH = 500  # Email body characters used as a fallback description
+TASK_NAME_MAX_LENGTH = 500  # Maximum task name length accepted before submission
 
 # Custom field mapping definitions (to be implemented)
 CUSTOM_FIELD_MAPPINGS = {}
@@ -8,14 +8,33 @@ This module provides:
 - Email metadata extraction (sender, subject, body, date, attachments)
 """
 
+import functools
 import logging
+import re
 from typing import Optional, Protocol
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs, urlparse, urlsplit
 
 from config import EmailContent, EmailPlatform
 
 logger = logging.getLogger("clickup_task_creator")
 
+# Email platform for each known web client host
+_HOST_TO_PLATFORM: dict[str, EmailPlatform] = {
+    "mail.google.com": EmailPlatform.GMAIL,
+    "outlook.office.com": EmailPlatform.OUTLOOK,
+    "outlook.office365.com": EmailPlatform.OUTLOOK,
+    "outlook.live.com": EmailPlatform.OUTLOOK,
+}
+
+# Domain suffixes checked when the host is not an exact match
+_DOMAIN_TO_PLATFORM: tuple[tuple[str, EmailPlatform], ...] = (
+    ("gmail.com", EmailPlatform.GMAIL),
+    ("outlook.com", EmailPlatform.OUTLOOK),
+)
+
+# Precompiled pattern for Gmail message ID parsing
+_GMAIL_MESSAGE_ID_RE = re.compile(r"/([^/]+)$")
+
 
 class EmailExtractionError(Exception):
     """Raised when email extraction fails."""
@@ -92,14 +111,8 @@ class GmailClient:
         """
         # Gmail URLs: https://mail.google.com/mail/u/0/#inbox/message_id
         parsed = urlparse(url)
-        fragment = parsed.fragment
-        
-        if "/" in fragment:
-            parts = fragment.split("/")
-            if len(parts) >= 2:
-                return parts[-1]
-        
-        return ""
+        match = _GMAIL_MESSAGE_ID_RE.search(parsed.fragment)
+        return match.group(1) if match else ""
 
 
 class OutlookClient:
@@ -155,9 +168,20 @@ class OutlookClient:
         return ""
 
 
+# Email client class for each platform (enum members are singletons, so this is a hash lookup)
+_CLIENT_FACTORIES: dict[EmailPlatform, type] = {
+    EmailPlatform.GMAIL: GmailClient,
+    EmailPlatform.OUTLOOK: OutlookClient,
+}
+
+
+@functools.lru_cache(maxsize=None)
 def create_email_client(platform: EmailPlatform, api_key: Optional[str] = None) -> EmailClient:
     """Factory function to create appropriate email client.
     
+    Clients are cached per (platform, api_key), so repeated calls reuse
+    the same instance.
+    
     Args:
         platform: Email platform type
         api_key: Optional API key for authenticated access
@@ -168,12 +192,10 @@ def create_email_client(platform: EmailPlatform, api_key: Optional[str] = None)
     Raises:
         ValueError: If platform is not supported
     """
-    if platform == EmailPlatform.GMAIL:
-        return GmailClient(api_key=api_key)
-    elif platform == EmailPlatform.OUTLOOK:
-        return OutlookClient(api_key=api_key)
-    else:
+    factory = _CLIENT_FACTORIES.get(platform)
+    if factory is None:
         raise ValueError(f"Unsupported email platform: {platform}")
+    return factory(api_key=api_key)
 
 
 def detect_email_platform(url: str) -> EmailPlatform:
@@ -188,11 +210,13 @@ def detect_email_platform(url: str) -> EmailPlatform:
     Raises:
         ValueError: If platform cannot be detected
     """
-    url_lower = url.lower()
-    
-    if "mail.google.com" in url_lower or "gmail.com" in url_lower:
-        return EmailPlatform.GMAIL
-    elif "outlook.office.com" in url_lower or "outlook.com" in url_lower:
-        return EmailPlatform.OUTLOOK
-    else:
-        raise ValueError(f"Could not detect email platform from URL: {url}")
+    # Only the host identifies the platform; urlsplit lowercases it
+    host = urlsplit(url).hostname or urlsplit(f"//{url}").hostname or ""
+    
+    platform = _HOST_TO_PLATFORM.get(host)
+    if platform is not None:
+        return platform
+    for domain, platform in _DOMAIN_TO_PLATFORM:
+        if host == domain or host.endswith(f".{domain}"):
+            return platform
+    raise ValueError(f"Could not detect email platform from URL: {url}")
@@ -2,13 +2,14 @@
 
 This module sets up Rich-enhanced logging with:
 - Colorful console output
-- Optional file logging
+- Optional buffered file logging (batched through a MemoryHandler)
 - Debug/Info/Error levels
 - Rich tracebacks for better error debugging
 """
 
 import logging
 import sys
+from logging.handlers import MemoryHandler
 from pathlib import Path
 from typing import Optional
 
@@ -16,41 +17,115 @@ from rich.console import Console
 from rich.logging import RichHandler
 from rich.traceback import install
 
+# Records buffered before a file write, and the file's write buffer size
+LOG_BUFFER_CAPACITY = 1000
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+
+# Whether rich.traceback.install() has already patched sys.excepthook
+_RICH_INSTALLED = False
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """File handler that writes through a large buffer without per-record flushes.
+    
+    Flushing is driven by the wrapping MemoryHandler and by close().
+    """
+    
+    def _open(self):
+        """Open the log file with an enlarged write buffer."""
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=LOG_FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors
+        )
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record to the buffered stream without flushing.
+        
+        Args:
+            record: Log record to write
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingMemoryHandler(MemoryHandler):
+    """MemoryHandler that also flushes its target's stream after a batch."""
+    
+    def flush(self) -> None:
+        """Hand buffered records to the target and flush its stream."""
+        super().flush()
+        if self.target is not None:
+            self.target.flush()
+    
+    def close(self) -> None:
+        """Flush remaining records, then close the target file handler.
+        
+        MemoryHandler.close() drops its target without closing it, which
+        would leave the log file open after every reconfiguration.
+        """
+        target = self.target
+        try:
+            super().close()
+        finally:
+            if target is not None:
+                target.close()
+
 
 def setup_logging(
     level: int = logging.INFO,
     log_file: Optional[str] = None,
-    use_rich: bool = True
+    use_rich: bool = True,
+    show_locals: bool = False
 ) -> logging.Logger:
     """Set up logging with Rich console handler and optional file handler.
     
     Args:
         level: Logging level (logging.DEBUG, logging.INFO, etc.)
         log_file: Optional path to log file for persistent logging
-        use_rich: Whether to use Rich formatting (default: True)
+        use_rich: Whether to use Rich formatting (default: True); ignored
+            when stdout is not a terminal
+        show_locals: Whether Rich tracebacks render local variables
+            (default: False, as locals may hold whole email bodies)
     
     Returns:
         Configured logger instance
     """
-    # Install Rich tracebacks for better error messages
-    if use_rich:
-        install(show_locals=True)
+    global _RICH_INSTALLED
+    
+    # Rich output is wasted on pipes and files, so fall back to plain logging
+    use_rich = use_rich and sys.stdout.isatty()
+    
+    # Install Rich tracebacks once per process
+    if use_rich and not _RICH_INSTALLED:
+        install(show_locals=show_locals)
+        _RICH_INSTALLED = True
     
     # Create logger
     logger = logging.getLogger("clickup_task_creator")
     logger.setLevel(level)
     
-    # Remove existing handlers to avoid duplicates
+    # Remove existing handlers to avoid duplicates (closing flushes buffered records)
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
     
     # Console handler with Rich formatting
     if use_rich:
+        # Time and caller path are only worth their per-record cost when debugging
+        verbose = level <= logging.DEBUG
         console_handler = RichHandler(
             rich_tracebacks=True,
             markup=True,
-            show_time=True,
+            show_time=verbose,
             show_level=True,
-            show_path=True
+            show_path=verbose
         )
     else:
         console_handler = logging.StreamHandler(sys.stdout)
@@ -66,11 +141,20 @@ def setup_logging(
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_path)
+        file_handler = _BufferedFileHandler(log_path)
         file_handler.setLevel(level)
         file_handler.setFormatter(
             logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         )
-        logger.addHandler(file_handler)
+        
+        # Batch records into large writes; errors and shutdown flush immediately
+        buffered_handler = _FlushingMemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        buffered_handler.setLevel(level)
+        logger.addHandler(buffered_handler)
     
     return logger
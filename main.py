@@ -9,28 +9,37 @@ This module provides:
 """
 
 import argparse
+import functools
 import logging
 import sys
 from pathlib import Path
+from typing import Optional
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm
-
-from auth import load_clickup_api_key, load_gemini_api_key
 from config import ClickUpTaskConfig, EmailPlatform
-from logger_config import setup_logging
-from task_creator import ClickUpTaskCreator, TaskCreationError
 from version import __version__, __description__
 
-console = Console()
+# Rich, auth and the task workflow are imported where they are used so that
+# --help and --version only pay for argparse.
 
 
-def parse_arguments() -> argparse.Namespace:
-    """Parse command line arguments.
+@functools.lru_cache(maxsize=1)
+def _get_console():
+    """Create the shared Rich console on first use.
     
     Returns:
-        Parsed arguments namespace
+        Rich Console instance
+    """
+    from rich.console import Console
+    
+    return Console()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once and reuse it.
+    
+    Returns:
+        Configured argument parser
     """
     parser = argparse.ArgumentParser(
         description=__description__,
@@ -102,6 +111,12 @@ def parse_arguments() -> argparse.Namespace:
         help="Disable AI email analysis"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk AI analysis cache"
+    )
+    
     parser.add_argument(
         "--interactive",
         action="store_true",
@@ -123,21 +138,76 @@ def parse_arguments() -> argparse.Namespace:
         help="Optional log file path"
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        "--debug-tracebacks",
+        action="store_true",
+        help="Include local variables in error tracebacks"
+    )
+    
+    return parser
 
 
-def show_welcome():
-    """Display welcome banner."""
-    welcome_text = """
+def parse_arguments(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments.
+    
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+    
+    Returns:
+        Parsed arguments namespace
+    """
+    return _build_parser().parse_args(argv)
+
+
+@functools.lru_cache(maxsize=1)
+def _welcome_panel():
+    """Build the welcome banner panel once.
+    
+    Returns:
+        Rich Panel with the welcome banner
+    """
+    from rich.panel import Panel
+    
+    welcome_text = f"""
 [bold cyan]ClickUp Task Creator[/bold cyan] 📧➡️📋
 
 Create ClickUp tasks directly from email URLs
 with AI-powered field population.
 
-Version: {version}
-    """.format(version=__version__)
+Version: {__version__}
+    """
     
-    console.print(Panel(welcome_text, border_style="cyan"))
+    return Panel(welcome_text, border_style="cyan")
+
+
+def show_welcome():
+    """Display welcome banner."""
+    _get_console().print(_welcome_panel())
+
+
+def _value_or_prompt(value: Optional[str], label: str, flag: str, can_prompt: bool) -> str:
+    """Return a CLI value, prompting for it only when a terminal is attached.
+    
+    Args:
+        value: Value from CLI argument
+        label: Human-readable name for the prompt
+        flag: CLI flag that supplies the value
+        can_prompt: Whether stdin is interactive
+    
+    Returns:
+        The provided or entered value
+    
+    Raises:
+        ValueError: If the value is missing and prompting is not possible
+    """
+    if value:
+        return value
+    if not can_prompt:
+        raise ValueError(f"{label} is required: pass {flag} when running non-interactively")
+    
+    from rich.prompt import Prompt
+    
+    return Prompt.ask(f"[yellow]{label}[/yellow]")
 
 
 def build_config(args: argparse.Namespace) -> ClickUpTaskConfig:
@@ -149,21 +219,31 @@ def build_config(args: argparse.Namespace) -> ClickUpTaskConfig:
     Returns:
         Complete configuration
     """
+    from rich.prompt import Confirm
+    
+    from auth import load_clickup_api_key, load_gemini_api_key
+    
+    console = _get_console()
     console.print("\n[bold]🔧 Configuration[/bold]")
     
     # Load API keys
     clickup_api_key = load_clickup_api_key(args.api_key)
     
+    # Only prompt when attached to a terminal so scripted runs never block on stdin
+    can_prompt = sys.stdin.isatty()
+    
     # Determine if AI summary is enabled
-    enable_ai = args.ai_summary
     if args.no_ai_summary:
         enable_ai = False
-    elif not args.ai_summary:
-        # Prompt user if not specified
+    elif args.ai_summary:
+        enable_ai = True
+    elif can_prompt:
         enable_ai = Confirm.ask(
             "[yellow]Enable AI email analysis?[/yellow]",
             default=True
         )
+    else:
+        enable_ai = True  # Default for non-interactive runs
     
     # Load Gemini API key if AI is enabled
     gemini_api_key = None
@@ -174,11 +254,9 @@ def build_config(args: argparse.Namespace) -> ClickUpTaskConfig:
             enable_ai = False
     
     # Get workspace/space/list (required)
-    from rich.prompt import Prompt
-    
-    workspace_name = args.workspace or Prompt.ask("[yellow]Workspace name[/yellow]")
-    space_name = args.space or Prompt.ask("[yellow]Space name[/yellow]")
-    list_name = args.list or Prompt.ask("[yellow]List name[/yellow]")
+    workspace_name = _value_or_prompt(args.workspace, "Workspace name", "--workspace", can_prompt)
+    space_name = _value_or_prompt(args.space, "Space name", "--space", can_prompt)
+    list_name = _value_or_prompt(args.list, "List name", "--list", can_prompt)
     
     # Email platform
     email_platform = None
@@ -192,6 +270,7 @@ def build_config(args: argparse.Namespace) -> ClickUpTaskConfig:
         list_name=list_name,
         gemini_api_key=gemini_api_key,
         enable_ai_summary=enable_ai,
+        use_analysis_cache=not args.no_cache,
         email_platform=email_platform,
         interactive=args.interactive
     )
@@ -202,12 +281,21 @@ def main():
     # Parse arguments
     args = parse_arguments()
     
+    from rich.panel import Panel
+    
+    from logger_config import setup_logging
+    from task_creator import ClickUpTaskCreator, TaskCreationError
+    
+    console = _get_console()
+    
     # Setup logging
     log_level = getattr(logging, args.log_level)
-    setup_logging(level=log_level, log_file=args.log_file)
-    
-    logger = logging.getLogger("clickup_task_creator")
-    logger.info(f"ClickUp Task Creator v{__version__} starting")
+    logger = setup_logging(
+        level=log_level,
+        log_file=args.log_file,
+        show_locals=args.debug_tracebacks
+    )
+    logger.info("ClickUp Task Creator v%s starting", __version__)
     
     try:
         # Show welcome
@@ -226,13 +314,12 @@ def main():
             console.print("[red]❌ Email URL is required[/red]")
             sys.exit(1)
         
-        # Create task
-        console.print("\n[bold]🚀 Creating Task[/bold]")
-        creator = ClickUpTaskCreator(config)
-        
-        # Interactive preview if enabled
+        # Create task (header and interactive notice are printed together)
+        status = "\n[bold]🚀 Creating Task[/bold]"
         if config.interactive:
-            console.print("[yellow]⚠ Interactive mode - preview will be shown before creation[/yellow]")
+            status += "\n[yellow]⚠ Interactive mode - preview will be shown before creation[/yellow]"
+        console.print(status)
+        creator = ClickUpTaskCreator(config)
         
         # Create task
         task = creator.create_task_from_email(email_url)
@@ -254,7 +341,7 @@ def main():
             title="Error",
             border_style="red"
         ))
-        logger.error(f"Task creation error: {e}")
+        logger.error("Task creation error: %s", e)
         sys.exit(1)
     
     except KeyboardInterrupt:
@@ -267,7 +354,11 @@ def main():
             title="Error",
             border_style="red"
         ))
-        logger.exception("Unexpected error")
+        # Full tracebacks are only rendered when debugging
+        if log_level <= logging.DEBUG:
+            logger.exception("Unexpected error")
+        else:
+            logger.error("Unexpected error: %s", e)
         sys.exit(1)
 
 
@@ -9,12 +9,13 @@ This module provides:
 """
 
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
+from rich.text import Text
 
 from config import CustomFieldType, EmailContent
 
@@ -67,26 +68,30 @@ def get_confirmation_input(task_payload: dict) -> bool:
     Returns:
         True if user confirms, False otherwise
     """
-    console.print("\n[bold cyan]📋 Task Preview[/bold cyan]")
-    
     # Create preview table
     table = Table(show_header=False, box=None)
     table.add_column("Field", style="cyan")
     table.add_column("Value", style="white")
     
     table.add_row("Title", task_payload.get("name", "N/A"))
-    table.add_row("Description", task_payload.get("description", "N/A")[:100] + "...")
+    description = task_payload.get("description") or "N/A"
+    if len(description) > 100:
+        description = description[:100] + "…"
+    table.add_row("Description", description)
     
     # Show custom fields if present
-    if "custom_fields" in task_payload:
-        for field in task_payload["custom_fields"]:
-            table.add_row(
-                f"  {field.get('name', 'Unknown')}",
-                str(field.get('value', 'N/A'))
-            )
-    
-    console.print(table)
-    console.print()
+    for field in task_payload.get("custom_fields", ()):
+        table.add_row(
+            f"  {field.get('name', 'Unknown')}",
+            str(field.get('value', 'N/A'))
+        )
+    
+    # Header, table and spacing are rendered in a single print
+    console.print(Group(
+        Text.from_markup("\n[bold cyan]📋 Task Preview[/bold cyan]"),
+        table,
+        Text()
+    ))
     
     return Confirm.ask("[yellow]Create this task?[/yellow]", default=True)
 
@@ -139,6 +144,43 @@ def map_email_field(
     return None
 
 
+def _to_float(value: Any) -> float:
+    """Convert value to float, defaulting to 0.0 when not numeric.
+    
+    Args:
+        value: Raw value to convert
+    
+    Returns:
+        Float value
+    """
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _identity(value: Any) -> Any:
+    """Return value unchanged.
+    
+    Args:
+        value: Raw value
+    
+    Returns:
+        The same value
+    """
+    return value
+
+
+# Converter for each custom field type (one dict lookup instead of an if/elif chain)
+_CONVERTERS: dict[CustomFieldType, Callable[[Any], Any]] = {
+    CustomFieldType.TEXT: str,
+    CustomFieldType.NUMBER: _to_float,
+    CustomFieldType.CHECKBOX: bool,
+    CustomFieldType.DATE: _identity,  # TODO: Implement date conversion
+    CustomFieldType.DROPDOWN: str,
+}
+
+
 def build_custom_field_value(value: Any, field_type: CustomFieldType) -> Any:
     """Convert value to appropriate type for custom field.
     
@@ -149,19 +191,4 @@ def build_custom_field_value(value: Any, field_type: CustomFieldType) -> Any:
     Returns:
         Converted value
     """
-    if field_type == CustomFieldType.TEXT:
-        return str(value)
-    elif field_type == CustomFieldType.NUMBER:
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return 0.0
-    elif field_type == CustomFieldType.CHECKBOX:
-        return bool(value)
-    elif field_type == CustomFieldType.DATE:
-        # TODO: Implement date conversion
-        return value
-    elif field_type == CustomFieldType.DROPDOWN:
-        return str(value)
-    
-    return value
+    return _CONVERTERS.get(field_type, _identity)(value)
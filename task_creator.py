@@ -10,12 +10,35 @@ This module provides:
 import logging
 from typing import Optional
 
-from api_client import ClickUpAPIClient
-from config import ClickUpTaskConfig, EmailAnalysis, EmailContent
-from email_client import create_email_client, detect_email_platform
+from api_client import APIError, ClickUpAPIClient, get_client
+from config import (
+    ClickUpTaskConfig,
+    EmailAnalysis,
+    EmailContent,
+    TASK_DESCRIPTION_MAX_LENGTH,
+    TASK_NAME_MAX_LENGTH,
+)
 
 logger = logging.getLogger("clickup_task_creator")
 
+# JSON Schema for task payloads sent to the ClickUp API. The fallback checks in
+# TaskBuilder.validate_payload must accept exactly the same payloads.
+_TASK_SCHEMA = {
+    "type": "object",
+    "required": ["name"],
+    "properties": {
+        "name": {"type": "string", "minLength": 1, "maxLength": TASK_NAME_MAX_LENGTH},
+    },
+}
+
+# Compile the schema once when jsonschema is installed
+try:
+    from jsonschema import Draft202012Validator
+    from jsonschema.exceptions import best_match
+    _TASK_VALIDATOR = Draft202012Validator(_TASK_SCHEMA)
+except ImportError:
+    _TASK_VALIDATOR = None
+
 
 class TaskCreationError(Exception):
     """Raised when task creation fails."""
@@ -42,7 +65,14 @@ class ClickUpTaskCreator:
             config: ClickUp task configuration
         """
         self.config = config
-        self.api_client = ClickUpAPIClient(config.api_key)
+        self._api_client: Optional[ClickUpAPIClient] = None
+    
+    @property
+    def api_client(self) -> ClickUpAPIClient:
+        """ClickUp API client, created on first use and shared per API key."""
+        if self._api_client is None:
+            self._api_client = get_client(self.config.api_key)
+        return self._api_client
     
     def create_task_from_email(self, email_url: str) -> dict:
         """Create ClickUp task from email URL.
@@ -56,7 +86,9 @@ class ClickUpTaskCreator:
         Raises:
             TaskCreationError: If task creation fails
         """
-        logger.info(f"Creating task from email URL: {email_url}")
+        logger.info("Creating task from email URL: %s", email_url)
+        
+        from email_client import create_email_client, detect_email_platform
         
         # Step 1: Detect email platform
         if not self.config.email_platform:
@@ -73,7 +105,11 @@ class ClickUpTaskCreator:
         email_analysis = None
         if self.config.enable_ai_summary and self.config.gemini_api_key:
             from ai_summary import analyze_email
-            email_analysis = analyze_email(email_content, self.config.gemini_api_key)
+            email_analysis = analyze_email(
+                email_content,
+                self.config.gemini_api_key,
+                use_analysis_cache=self.config.use_analysis_cache
+            )
         
         # Step 4: Build task payload
         task_builder = TaskBuilder(self.config)
@@ -87,10 +123,10 @@ class ClickUpTaskCreator:
         list_id = self._get_list_id()
         
         # Step 7: Create task
-        logger.info(f"Creating task in list {list_id}")
+        logger.info("Creating task in list %s", list_id)
         created_task = self.api_client.create_task(list_id, task_payload)
         
-        logger.info(f"Task created successfully: {created_task.get('id')}")
+        logger.info("Task created successfully: %s", created_task.get("id"))
         return created_task
     
     def _get_list_id(self) -> str:
@@ -102,9 +138,14 @@ class ClickUpTaskCreator:
         Raises:
             TaskCreationError: If list cannot be found
         """
-        # TODO: Implement list discovery
-        # For now, raise not implemented
-        raise NotImplementedError("List discovery not yet implemented")
+        try:
+            return self.api_client.resolve_list_id(
+                self.config.workspace_name,
+                self.config.space_name,
+                self.config.list_name
+            )
+        except APIError as e:
+            raise TaskCreationError(f"Could not find ClickUp list: {e}")
 
 
 class TaskBuilder:
@@ -146,7 +187,11 @@ class TaskBuilder:
             task_description = email_analysis.description
         else:
             task_name = email_content.subject
-            task_description = email_content.body[:500]  # Truncate body
+            body = email_content.body
+            task_description = (
+                body if len(body) <= TASK_DESCRIPTION_MAX_LENGTH
+                else body[:TASK_DESCRIPTION_MAX_LENGTH]
+            )
         
         payload = {
             "name": task_name,
@@ -161,7 +206,7 @@ class TaskBuilder:
                 email_analysis
             )
         
-        logger.debug(f"Task payload built: {payload.get('name')}")
+        logger.debug("Task payload built: %s", payload["name"])
         return payload
     
     def _build_custom_fields(
@@ -194,14 +239,23 @@ class TaskBuilder:
         Returns:
             True if valid, False otherwise
         """
+        if _TASK_VALIDATOR is not None:
+            error = best_match(_TASK_VALIDATOR.iter_errors(payload))
+            if error is not None:
+                logger.error("Invalid task payload: %s", error.message)
+                return False
+            logger.debug("Task payload is valid")
+            return True
+        
         # Check required fields
-        if not payload.get("name"):
+        name = payload.get("name")
+        if not isinstance(name, str) or not name:
             logger.error("Task name is required")
             return False
         
         # Check name length
-        if len(payload["name"]) > 500:
-            logger.error("Task name too long (max 500 characters)")
+        if len(name) > TASK_NAME_MAX_LENGTH:
+            logger.error("Task name too long (max %d characters)", TASK_NAME_MAX_LENGTH)
             return False
         
         logger.debug("Task payload is valid")
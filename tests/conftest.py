@@ -0,0 +1,13 @@
+"""Shared pytest fixtures for ClickUp Task Creator tests."""
+
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture
+def mock_session_request(monkeypatch):
+    """Replace requests.Session.request used by api_client with a Mock."""
+    mock_request = Mock()
+    monkeypatch.setattr("api_client.requests.Session.request", mock_request)
+    return mock_request
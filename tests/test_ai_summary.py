@@ -3,8 +3,16 @@
 import pytest
 from unittest.mock import Mock, patch
 
-from ai_summary import _basic_email_analysis, _parse_retry_delay
-from config import EmailContent
+from ai_summary import (
+    PROMPT_PREFIX,
+    _basic_email_analysis,
+    _build_analysis_prompt,
+    analyze_email,
+    _get_model,
+    _parse_gemini_response,
+    _parse_retry_delay,
+)
+from config import EmailAnalysis, EmailContent
 
 
 def test_basic_email_analysis():
@@ -26,14 +34,190 @@ def test_basic_email_analysis():
 
 
 def test_parse_retry_delay():
-    """Test parsing retry delay from error message."""
-    error_msg = "Rate limit exceeded. Retry after 30 seconds"
-    delay = _parse_retry_delay(error_msg)
+    """Test parsing retry delay from the error's RetryInfo detail."""
+    error = Exception("Resource exhausted")
+    error.details = [Mock(retry_delay=Mock(seconds=30))]
+    delay = _parse_retry_delay(error)
     assert delay == 30
 
 
 def test_parse_retry_delay_default():
-    """Test default retry delay when not found in message."""
-    error_msg = "Unknown error"
-    delay = _parse_retry_delay(error_msg)
+    """Test default retry delay when the error carries no hint."""
+    error = Exception("Unknown error")
+    delay = _parse_retry_delay(error)
     assert delay == 60
+
+
+def test_analyze_email_retries_resource_exhausted():
+    """Test that ResourceExhausted triggers a cooldown and retry."""
+    gax_exc = pytest.importorskip("google.api_core.exceptions")
+    email = EmailContent(
+        subject="Invoice due",
+        body="Please pay by Friday.",
+        sender="Billing",
+        sender_email="billing@example.com",
+        date="2025-01-01"
+    )
+    model = Mock()
+    model.generate_content.side_effect = [
+        gax_exc.ResourceExhausted("quota exceeded"),
+        Mock(text='{"title": "Pay invoice"}'),
+    ]
+    
+    with patch("ai_summary._get_genai", return_value=Mock()), \
+            patch("ai_summary._get_model", return_value=model), \
+            patch("ai_summary._start_cooldown") as mock_cooldown:
+        result = analyze_email(email, "gemini_key", use_analysis_cache=False)
+    
+    assert result.title == "Pay invoice"
+    mock_cooldown.assert_called_once_with(60)
+
+
+def test_build_analysis_prompt_excludes_prefix():
+    """Test that the per-email prompt omits the cached instruction scaffold."""
+    email = EmailContent(
+        subject="Invoice due",
+        body="Please pay by Friday.",
+        sender="Billing",
+        sender_email="billing@example.com",
+        date="2025-01-01"
+    )
+    
+    prompt = _build_analysis_prompt(email)
+    
+    assert "Invoice due" in prompt
+    assert "Please pay by Friday." in prompt
+    assert "Return ONLY valid JSON" not in prompt
+    assert "Return ONLY valid JSON" in PROMPT_PREFIX
+
+
+def test_get_model_uses_prefix_as_system_instruction():
+    """Test that the model carries the static prompt prefix."""
+    genai = Mock()
+    
+    with patch.dict("ai_summary._model_cache", clear=True), \
+            patch("ai_summary._configured_api_key", None):
+        model = _get_model(genai, "gemini_key")
+    
+    assert model is genai.GenerativeModel.return_value
+    genai.GenerativeModel.assert_called_once_with(
+        "gemini-2.5-flash-lite", system_instruction=PROMPT_PREFIX
+    )
+
+
+def test_parse_gemini_response_fenced_json():
+    """Test parsing Gemini JSON wrapped in a markdown code fence."""
+    response_text = '```json\n{"title": "Pay invoice", "priority": "High"}\n```'
+    
+    analysis = _parse_gemini_response(response_text)
+    
+    assert analysis.title == "Pay invoice"
+    assert analysis.priority == "High"
+
+
+@pytest.mark.parametrize("key_points", ["null", '"Pay now"', "3"])
+def test_parse_gemini_response_non_list_key_points(key_points):
+    """Test that null or non-list key points parse as an empty tuple."""
+    analysis = _parse_gemini_response(f'{{"title": "Pay invoice", "key_points": {key_points}}}')
+    
+    assert analysis.key_points == ()
+
+
+def test_analyze_email_reuses_model():
+    """Test that the Gemini module and model are set up once per API key."""
+    email = EmailContent(
+        subject="Invoice due",
+        body="Please pay by Friday.",
+        sender="Billing",
+        sender_email="billing@example.com",
+        date="2025-01-01"
+    )
+    genai = Mock()
+    model = genai.GenerativeModel.return_value
+    model.generate_content.return_value.text = '{"title": "Pay invoice"}'
+    
+    with patch("ai_summary._genai", genai), \
+            patch.dict("ai_summary._model_cache", clear=True), \
+            patch("ai_summary._configured_api_key", None):
+        first = analyze_email(email, "gemini_key", use_analysis_cache=False)
+        second = analyze_email(email, "gemini_key", use_analysis_cache=False)
+    
+    assert first.title == second.title == "Pay invoice"
+    genai.configure.assert_called_once_with(api_key="gemini_key")
+    assert model.generate_content.call_count == 2
+
+
+def test_get_model_reconfigures_when_key_changes():
+    """Test that switching API keys reconfigures the SDK before reusing a model."""
+    genai = Mock()
+    genai.GenerativeModel.side_effect = lambda *args, **kwargs: Mock()
+    
+    with patch.dict("ai_summary._model_cache", clear=True), \
+            patch("ai_summary._configured_api_key", None):
+        model_a = _get_model(genai, "key_a")
+        _get_model(genai, "key_b")
+        model_a_again = _get_model(genai, "key_a")
+    
+    assert model_a_again is model_a
+    assert [c.kwargs["api_key"] for c in genai.configure.call_args_list] == ["key_a", "key_b", "key_a"]
+
+
+def test_analyze_email_uses_analysis_cache():
+    """Test that a cached analysis skips the Gemini request."""
+    email = EmailContent(
+        subject="Invoice due",
+        body="Please pay by Friday.",
+        sender="Billing",
+        sender_email="billing@example.com",
+        date="2025-01-01"
+    )
+    cached = EmailAnalysis(title="Cached task", description="", priority="Normal")
+    cache = Mock()
+    cache.get.return_value = cached
+    
+    with patch("ai_summary._analysis_cache", cache), \
+            patch("ai_summary._get_genai") as mock_get_genai:
+        result = analyze_email(email, "gemini_key")
+    
+    assert result is cached
+    mock_get_genai.assert_not_called()
+
+
+def test_analyze_email_ignores_analysis_cache_failures():
+    """Test that cache read/write errors never retry or discard a Gemini result."""
+    email = EmailContent(
+        subject="Invoice due",
+        body="Please pay by Friday.",
+        sender="Billing",
+        sender_email="billing@example.com",
+        date="2025-01-01"
+    )
+    cache = Mock()
+    cache.get.side_effect = OSError("corrupt entry")
+    cache.set.side_effect = OSError("disk full")
+    model = Mock()
+    model.generate_content.return_value.text = '{"title": "Pay invoice"}'
+    
+    with patch("ai_summary._analysis_cache", cache), \
+            patch("ai_summary._get_genai", return_value=Mock()), \
+            patch("ai_summary._get_model", return_value=model):
+        result = analyze_email(email, "gemini_key")
+    
+    assert result.title == "Pay invoice"
+    model.generate_content.assert_called_once()
+    cache.set.assert_called_once()
+
+
+def test_basic_email_analysis_uses_first_three_lines():
+    """Test that the fallback description only uses the first three lines."""
+    email = EmailContent(
+        subject="Test Email Subject",
+        body="Line one\nLine two\n\nLine four\nLine five",
+        sender="Test Sender",
+        sender_email="test@example.com",
+        date="2025-01-01"
+    )
+    
+    analysis = _basic_email_analysis(email)
+    
+    assert analysis.description == "Line one Line two"
@@ -1,9 +1,19 @@
 """Tests for api_client module."""
 
+import io
+
 import pytest
-from unittest.mock import Mock, patch
+import requests
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
+from unittest.mock import MagicMock, Mock, patch
 
-from api_client import ClickUpAPIClient, APIError, RateLimitError
+from api_client import (
+    APIError,
+    ClickUpAPIClient,
+    RateLimitError,
+    _backoff_delay,
+    get_client,
+)
 
 
 def test_api_client_initialization():
@@ -14,30 +24,194 @@ def test_api_client_initialization():
     assert "Authorization" in client.session.headers
 
 
-@patch("api_client.requests.Session.request")
-def test_get_request(mock_request):
+def test_get_request(mock_session_request):
     """Test GET request."""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {"data": "test"}
-    mock_request.return_value = mock_response
+    mock_response.content = b'{"data": "test"}'
+    mock_session_request.return_value = mock_response
     
     client = ClickUpAPIClient(api_key="test_key")
     result = client.get("/test")
     
     assert result == {"data": "test"}
-    mock_request.assert_called_once()
+    mock_session_request.assert_called_once()
+    assert mock_session_request.call_args.kwargs["url"] == "https://api.clickup.com/api/v2/test"
 
 
-@patch("api_client.requests.Session.request")
-def test_post_request(mock_request):
+def test_post_request(mock_session_request):
     """Test POST request."""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {"id": "123"}
-    mock_request.return_value = mock_response
+    mock_response.content = b'{"id": "123"}'
+    mock_session_request.return_value = mock_response
     
     client = ClickUpAPIClient(api_key="test_key")
     result = client.post("/test", {"name": "test"})
     
     assert result == {"id": "123"}
+
+
+def test_invalid_json_raises_api_error(mock_session_request):
+    """Test that a non-JSON success body is reported as an APIError."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = b"<html>Bad Gateway</html>"
+    mock_session_request.return_value = mock_response
+    
+    client = ClickUpAPIClient(api_key="test_key")
+    
+    with pytest.raises(APIError):
+        client.get("/test")
+
+
+def test_get_client_reuses_instance():
+    """Test that clients are shared per API key."""
+    client = get_client("shared_key")
+    
+    assert get_client("shared_key") is client
+    assert get_client("other_key") is not client
+
+
+def test_session_uses_pooled_adapter():
+    """Test that the session mounts a tuned connection pool."""
+    client = ClickUpAPIClient(api_key="test_key")
+    adapter = client.session.get_adapter("https://api.clickup.com")
+    
+    assert adapter._pool_maxsize == 32
+
+
+def test_get_lists_bulk():
+    """Test fetching lists for multiple spaces."""
+    client = ClickUpAPIClient(api_key="test_key")
+    
+    with patch.object(client, "get_lists", side_effect=lambda space_id: [{"id": f"list_{space_id}"}]):
+        result = client.get_lists_bulk(["1", "2"])
+    
+    assert result == {"1": [{"id": "list_1"}], "2": [{"id": "list_2"}]}
+
+
+def test_backoff_delay_is_capped():
+    """Test that exponential backoff never exceeds the maximum delay."""
+    assert 1 <= _backoff_delay(0) <= 2
+    assert _backoff_delay(10) == 30
+
+
+@patch("api_client.requests.Session.get")
+def test_get_custom_fields_lean(mock_get):
+    """Test streaming custom fields keeps only the requested keys."""
+    pytest.importorskip("ijson")
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.raw = io.BytesIO(
+        b'{"fields": [{"id": "f1", "name": "Due", "type": "date", "type_config": {}}]}'
+    )
+    mock_get.return_value.__enter__.return_value = mock_response
+    
+    client = ClickUpAPIClient(api_key="test_key")
+    result = client.get_custom_fields_lean("list_1")
+    
+    assert result == [{"id": "f1", "name": "Due", "type": "date"}]
+
+
+@patch("api_client.requests.Session.get")
+def test_get_custom_fields_lean_error_is_not_refetched(mock_get, mock_session_request):
+    """Test that a failed streaming request raises instead of fetching again."""
+    pytest.importorskip("ijson")
+    mock_response = MagicMock()
+    mock_response.status_code = 404
+    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("404")
+    mock_get.return_value.__enter__.return_value = mock_response
+    
+    client = ClickUpAPIClient(api_key="test_key")
+    
+    with pytest.raises(APIError):
+        client.get_custom_fields_lean("list_1")
+    mock_get.assert_called_once()
+    mock_session_request.assert_not_called()
+
+
+@patch("api_client.requests.Session.get")
+def test_get_custom_fields_lean_uses_cache(mock_get):
+    """Test that lists already fetched are projected without a request."""
+    client = ClickUpAPIClient(api_key="test_key")
+    client._custom_fields_cache["list_1"] = [
+        {"id": "f1", "name": "Due", "type": "date", "type_config": {}}
+    ]
+    
+    assert client.get_custom_fields_lean("list_1") == [{"id": "f1", "name": "Due", "type": "date"}]
+    mock_get.assert_not_called()
+
+
+def test_session_retries_rate_limits_and_server_errors():
+    """Test that the session adapter retries 429 and 5xx responses."""
+    client = ClickUpAPIClient(api_key="test_key")
+    retry = client.session.get_adapter("https://api.clickup.com").max_retries
+    
+    assert retry.total == 3
+    assert 429 in retry.status_forcelist
+    assert 503 in retry.status_forcelist
+    assert retry.respect_retry_after_header is True
+
+
+def test_post_is_only_retried_when_refused():
+    """Test that POST is resent on 429/503 but never after a read error."""
+    client = ClickUpAPIClient(api_key="test_key")
+    retry = client.session.get_adapter("https://api.clickup.com").max_retries
+    
+    assert retry.is_retry("POST", 429) is True
+    assert retry.is_retry("POST", 500) is False
+    assert retry.is_retry("GET", 500) is True
+    with pytest.raises(ReadTimeoutError):
+        retry.increment(method="POST", url="/task", error=ReadTimeoutError(None, "/task", "timed out"))
+
+
+def test_exhausted_read_timeouts_raise_timeout_api_error(mock_session_request):
+    """Test that read timeouts wrapped in MaxRetryError are reported as timeouts."""
+    reason = ReadTimeoutError(None, "/test", "timed out")
+    mock_session_request.side_effect = requests.exceptions.ConnectionError(
+        MaxRetryError(None, "/test", reason)
+    )
+    
+    client = ClickUpAPIClient(api_key="test_key")
+    
+    with pytest.raises(APIError, match="timed out"):
+        client.get("/test")
+
+
+@patch("api_client._start_cooldown")
+def test_rate_limit_error_after_retries(mock_cooldown, mock_session_request):
+    """Test that an unresolved 429 raises RateLimitError and starts a cooldown."""
+    mock_response = Mock()
+    mock_response.status_code = 429
+    mock_response.headers = {"Retry-After": "5"}
+    mock_session_request.return_value = mock_response
+    
+    client = ClickUpAPIClient(api_key="test_key")
+    
+    with pytest.raises(RateLimitError):
+        client.get("/test")
+    mock_cooldown.assert_called_once_with(5)
+
+
+def test_resolve_list_id_is_cached():
+    """Test that list resolution walks the hierarchy only once."""
+    client = ClickUpAPIClient(api_key="test_key")
+    
+    with patch.object(client, "get_workspaces", return_value=[{"id": "t1", "name": "Work"}]) as mock_teams, \
+            patch.object(client, "get_spaces", return_value=[{"id": "s1", "name": "Ops"}]), \
+            patch.object(client, "get_lists", return_value=[{"id": "l1", "name": "Tasks"}]):
+        first = client.resolve_list_id("Work", "Ops", "tasks")
+        second = client.resolve_list_id("Work", "Ops", "tasks")
+    
+    assert first == second == "l1"
+    mock_teams.assert_called_once()
+
+
+def test_resolve_list_id_not_found():
+    """Test resolving an unknown list name."""
+    client = ClickUpAPIClient(api_key="test_key")
+    
+    with patch.object(client, "get_workspaces", return_value=[]):
+        with pytest.raises(APIError):
+            client.resolve_list_id("Missing", "Ops", "Tasks")
@@ -0,0 +1,95 @@
+"""Tests for async_api_client module."""
+
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from api_client import APIError
+from async_api_client import AsyncClickUpAPIClient, get_async_client
+
+
+def _mock_client(handler) -> AsyncClickUpAPIClient:
+    """Create an async client whose requests are served by handler."""
+    client = AsyncClickUpAPIClient(api_key="test_key")
+    client.client = httpx.AsyncClient(
+        base_url=client.client.base_url,
+        headers=client.client.headers,
+        transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def test_async_get_request():
+    """Test async GET request against the v2 base URL."""
+    def handler(request):
+        assert request.url == "https://api.clickup.com/api/v2/team"
+        assert request.headers["Authorization"] == "test_key"
+        return httpx.Response(200, json={"teams": [{"id": "1"}]})
+    
+    async def run():
+        client = _mock_client(handler)
+        try:
+            return await client.get_workspaces()
+        finally:
+            await client.aclose()
+    
+    assert asyncio.run(run()) == [{"id": "1"}]
+
+
+def test_async_get_lists_bulk():
+    """Test fetching lists for multiple spaces concurrently."""
+    def handler(request):
+        space_id = request.url.path.split("/")[-2]
+        return httpx.Response(200, json={"lists": [{"id": f"list_{space_id}"}]})
+    
+    async def run():
+        client = _mock_client(handler)
+        try:
+            return await client.get_lists_bulk(["1", "2"])
+        finally:
+            await client.aclose()
+    
+    assert asyncio.run(run()) == {"1": [{"id": "list_1"}], "2": [{"id": "list_2"}]}
+
+
+def test_get_async_client_reuses_instance_per_loop():
+    """Test that async clients are shared per event loop and API key."""
+    async def run():
+        client = get_async_client("shared_key")
+        same = get_async_client("shared_key") is client
+        await client.aclose()
+        return same
+    
+    assert asyncio.run(run()) is True
+
+
+def test_get_async_client_replaces_closed_client():
+    """Test that closing a shared client evicts it from the cache."""
+    async def run():
+        client = get_async_client("closed_key")
+        await client.aclose()
+        replacement = get_async_client("closed_key")
+        try:
+            return replacement is not client and not replacement.client.is_closed
+        finally:
+            await replacement.aclose()
+    
+    assert asyncio.run(run()) is True
+
+
+def test_async_invalid_json_raises_api_error():
+    """Test that a non-JSON success body is reported as an APIError."""
+    def handler(request):
+        return httpx.Response(200, content=b"<html>Bad Gateway</html>")
+    
+    async def run():
+        client = _mock_client(handler)
+        try:
+            await client.get("/team")
+        finally:
+            await client.aclose()
+    
+    with pytest.raises(APIError):
+        asyncio.run(run())
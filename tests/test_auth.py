@@ -1,11 +1,11 @@
 """Tests for auth module."""
 
 import os
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
-from auth import load_secret_with_fallback
+from auth import _op_session, _read_onepassword_cli, load_secret_with_fallback
 
 
 def test_load_secret_from_cli():
@@ -46,3 +46,64 @@ def test_load_secret_not_required():
     )
     
     assert result is None
+
+
+def test_load_secret_from_cache_skips_onepassword():
+    """Test that cached 1Password secrets short-circuit the lookup chain."""
+    with patch.dict("auth._SECRET_CACHE", {"op://cached": "cached_secret"}), \
+            patch("auth._read_onepassword_cli") as mock_cli:
+        result = load_secret_with_fallback(
+            cli_value=None,
+            env_var_name="NONEXISTENT_ENV",
+            onepassword_ref="op://cached",
+            secret_name="Test Secret",
+            required=True
+        )
+    
+    assert result == "cached_secret"
+    mock_cli.assert_not_called()
+
+
+def test_load_secret_prompts_when_required():
+    """Test that a required secret falls back to a password prompt."""
+    with patch("auth._read_onepassword_sdk", return_value=None), \
+            patch("auth._read_onepassword_cli", return_value=None), \
+            patch("auth.getpass.getpass", return_value="typed_secret") as mock_getpass:
+        result = load_secret_with_fallback(
+            cli_value=None,
+            env_var_name="NONEXISTENT_ENV",
+            onepassword_ref="op://missing",
+            secret_name="Test Secret",
+            required=True
+        )
+    
+    assert result == "typed_secret"
+    mock_getpass.assert_called_once()
+
+
+def test_onepassword_cli_reuses_session():
+    """Test that the 1Password CLI signs in once and passes the session."""
+    signin = Mock(returncode=0, stdout='export OP_SESSION_my="session_token"\n')
+    read = Mock(returncode=0, stdout="cli_secret\n")
+    
+    _op_session.cache_clear()
+    try:
+        with patch("auth._SDK_WORKS", False), \
+                patch.dict("auth._SECRET_CACHE", clear=True), \
+                patch("auth.subprocess.run", side_effect=[signin, read, read]) as mock_run:
+            assert _read_onepassword_cli("op://first") == "cli_secret"
+            assert _read_onepassword_cli("op://second") == "cli_secret"
+    finally:
+        _op_session.cache_clear()
+    
+    assert mock_run.call_count == 3
+    assert mock_run.call_args.args[0] == ["op", "read", "op://second"]
+    assert mock_run.call_args.kwargs["env"]["OP_SESSION_my"] == "session_token"
+
+
+def test_onepassword_cli_skipped_after_sdk_success():
+    """Test that the CLI is not spawned once the SDK has worked."""
+    with patch("auth._SDK_WORKS", True), patch("auth.subprocess.run") as mock_run:
+        assert _read_onepassword_cli("op://test") is None
+    
+    mock_run.assert_not_called()
@@ -1,5 +1,7 @@
 """Tests for config module."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from config import (
@@ -61,7 +63,7 @@ def test_email_analysis_dataclass():
         description="Test Description",
         priority="High",
         due_date="2025-01-01",
-        key_points=["Point 1", "Point 2"],
+        key_points=("Point 1", "Point 2"),
         confidence=0.9
     )
     
@@ -70,6 +72,16 @@ def test_email_analysis_dataclass():
     assert len(analysis.key_points) == 2
 
 
+def test_email_analysis_is_immutable():
+    """Test EmailAnalysis is frozen and slotted."""
+    analysis = EmailAnalysis(title="Test Task", description="", priority="Normal")
+    
+    assert analysis.key_points == ()
+    assert not hasattr(analysis, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        analysis.title = "Changed"
+
+
 def test_clickup_task_config():
     """Test ClickUpTaskConfig dataclass."""
     config = ClickUpTaskConfig(
@@ -11,30 +11,31 @@ from email_client import (
 )
 
 
-def test_detect_gmail_platform():
-    """Test detecting Gmail platform from URL."""
-    url = "https://mail.google.com/mail/u/0/#inbox/12345"
-    platform = detect_email_platform(url)
-    assert platform == EmailPlatform.GMAIL
+@pytest.mark.parametrize("url,expected", [
+    ("https://mail.google.com/mail/u/0/#inbox/12345", EmailPlatform.GMAIL),
+    ("https://outlook.office.com/mail/inbox/12345", EmailPlatform.OUTLOOK),
+])
+def test_detect_email_platform(url, expected):
+    """Test detecting the email platform from a URL."""
+    assert detect_email_platform(url) == expected
 
 
-def test_detect_outlook_platform():
-    """Test detecting Outlook platform from URL."""
-    url = "https://outlook.office.com/mail/inbox/12345"
-    platform = detect_email_platform(url)
-    assert platform == EmailPlatform.OUTLOOK
+@pytest.mark.parametrize("platform,client_class", [
+    (EmailPlatform.GMAIL, GmailClient),
+    (EmailPlatform.OUTLOOK, OutlookClient),
+])
+def test_create_email_client(platform, client_class):
+    """Test creating the client for each platform."""
+    client = create_email_client(platform)
+    assert isinstance(client, client_class)
 
 
-def test_create_gmail_client():
-    """Test creating Gmail client."""
+def test_create_email_client_is_cached():
+    """Test that the factory reuses clients per platform and API key."""
     client = create_email_client(EmailPlatform.GMAIL)
-    assert isinstance(client, GmailClient)
-
-
-def test_create_outlook_client():
-    """Test creating Outlook client."""
-    client = create_email_client(EmailPlatform.OUTLOOK)
-    assert isinstance(client, OutlookClient)
+    
+    assert create_email_client(EmailPlatform.GMAIL) is client
+    assert create_email_client(EmailPlatform.GMAIL, api_key="key") is not client
 
 
 def test_gmail_parse_message_id():
@@ -43,3 +44,26 @@ def test_gmail_parse_message_id():
     url = "https://mail.google.com/mail/u/0/#inbox/12345abcdef"
     message_id = client._parse_message_id(url)
     assert message_id == "12345abcdef"
+
+
+def test_detect_platform_case_insensitive():
+    """Test platform detection ignores URL case."""
+    assert detect_email_platform("https://MAIL.Google.com/mail/u/0/#inbox/1") == EmailPlatform.GMAIL
+
+
+def test_detect_platform_ignores_host_lookalikes():
+    """Test that platform hosts appearing outside the host are not matched."""
+    with pytest.raises(ValueError):
+        detect_email_platform("https://example.com/?next=mail.google.com")
+
+
+def test_detect_unknown_platform():
+    """Test detecting platform from unsupported URL."""
+    with pytest.raises(ValueError):
+        detect_email_platform("https://example.com/mail/12345")
+
+
+def test_create_unsupported_client():
+    """Test creating a client for an unsupported platform."""
+    with pytest.raises(ValueError):
+        create_email_client("YAHOO")
@@ -0,0 +1,71 @@
+"""Tests for logger_config module."""
+
+import logging
+from unittest.mock import patch
+
+from logger_config import setup_logging
+
+
+def test_file_logging_is_buffered_until_error(tmp_path):
+    """Test that file records are batched and flushed on ERROR."""
+    log_file = tmp_path / "logs" / "app.log"
+    logger = setup_logging(level=logging.INFO, log_file=str(log_file), use_rich=False)
+    
+    try:
+        logger.info("buffered message")
+        assert log_file.read_text() == ""
+        
+        logger.error("flushing message")
+        contents = log_file.read_text()
+        assert "buffered message" in contents
+        assert "flushing message" in contents
+    finally:
+        for handler in logger.handlers:
+            handler.close()
+        logger.handlers.clear()
+
+
+def test_reconfigure_closes_log_file(tmp_path):
+    """Test that reconfiguring logging closes the previous log file."""
+    logger = setup_logging(level=logging.INFO, log_file=str(tmp_path / "app.log"), use_rich=False)
+    file_handler = logger.handlers[-1].target
+    file_handler.emit(logging.makeLogRecord({"msg": "opened"}))
+    
+    logger = setup_logging(level=logging.INFO, use_rich=False)
+    logger.handlers.clear()
+    
+    assert file_handler.stream is None
+
+
+def test_rich_traceback_installed_once():
+    """Test that repeated setup only installs Rich tracebacks once."""
+    with patch("logger_config._RICH_INSTALLED", False), \
+            patch("logger_config.sys.stdout.isatty", return_value=True), \
+            patch("logger_config.install") as mock_install:
+        logger = setup_logging(level=logging.INFO)
+        setup_logging(level=logging.DEBUG)
+    logger.handlers.clear()
+    
+    mock_install.assert_called_once_with(show_locals=False)
+
+
+def test_plain_handler_when_not_a_tty():
+    """Test that piped output uses a plain stdlib handler."""
+    with patch("logger_config.sys.stdout.isatty", return_value=False):
+        logger = setup_logging(level=logging.INFO, use_rich=True)
+    
+    try:
+        assert [type(handler) for handler in logger.handlers] == [logging.StreamHandler]
+    finally:
+        logger.handlers.clear()
+
+
+def test_rich_traceback_show_locals_opt_in():
+    """Test that local variables are only rendered when requested."""
+    with patch("logger_config._RICH_INSTALLED", False), \
+            patch("logger_config.sys.stdout.isatty", return_value=True), \
+            patch("logger_config.install") as mock_install:
+        logger = setup_logging(level=logging.INFO, show_locals=True)
+    logger.handlers.clear()
+    
+    mock_install.assert_called_once_with(show_locals=True)
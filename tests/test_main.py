@@ -1,33 +1,93 @@
 """Tests for main module."""
 
-import pytest
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
-from main import parse_arguments
+import pytest
+
+from main import _build_parser, _welcome_panel, build_config, parse_arguments
+from version import __version__
 
 
 def test_parse_arguments_defaults():
     """Test parsing arguments with defaults."""
-    with patch("sys.argv", ["main.py"]):
-        args = parse_arguments()
-        
-        assert args.log_level == "INFO"
-        assert args.interactive is False
-        assert args.ai_summary is False
+    args = parse_arguments([])
+    
+    assert args.log_level == "INFO"
+    assert args.interactive is False
+    assert args.ai_summary is False
+    assert args.debug_tracebacks is False
 
 
 def test_parse_arguments_with_options():
     """Test parsing arguments with options."""
-    with patch("sys.argv", [
-        "main.py",
+    args = parse_arguments([
         "--email-url", "https://mail.google.com/test",
         "--api-key", "test_key",
         "--workspace", "Test",
         "--interactive"
-    ]):
-        args = parse_arguments()
-        
-        assert args.email_url == "https://mail.google.com/test"
-        assert args.api_key == "test_key"
-        assert args.workspace == "Test"
-        assert args.interactive is True
+    ])
+    
+    assert args.email_url == "https://mail.google.com/test"
+    assert args.api_key == "test_key"
+    assert args.workspace == "Test"
+    assert args.interactive is True
+
+
+def test_import_main_defers_heavy_modules():
+    """Test that importing main does not load Rich or the task workflow."""
+    code = (
+        "import sys, main; "
+        "print(any(m in sys.modules for m in ('rich', 'requests', 'task_creator')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    
+    assert result.stdout.strip() == "False"
+
+
+def test_parser_is_built_once():
+    """Test that the argument parser is cached between calls."""
+    assert _build_parser() is _build_parser()
+
+
+def test_build_config_non_interactive_skips_prompts():
+    """Test that build_config does not prompt when stdin is not a TTY."""
+    args = parse_arguments(["--workspace", "W", "--space", "S", "--list", "L"])
+    
+    with patch("sys.stdin") as mock_stdin, \
+            patch("auth.load_clickup_api_key", return_value="clickup_key"), \
+            patch("auth.load_gemini_api_key", return_value="gemini_key"), \
+            patch("rich.prompt.Confirm.ask") as mock_confirm:
+        mock_stdin.isatty.return_value = False
+        config = build_config(args)
+    
+    mock_confirm.assert_not_called()
+    assert config.enable_ai_summary is True
+    assert config.workspace_name == "W"
+
+
+def test_build_config_non_interactive_requires_list():
+    """Test that missing list names fail fast without a TTY."""
+    args = parse_arguments(["--no-ai-summary"])
+    
+    with patch("sys.stdin") as mock_stdin, \
+            patch("auth.load_clickup_api_key", return_value="clickup_key"):
+        mock_stdin.isatty.return_value = False
+        with pytest.raises(ValueError, match="--workspace"):
+            build_config(args)
+
+
+def test_welcome_panel_is_built_once():
+    """Test that the welcome banner is only built once."""
+    panel = _welcome_panel()
+    
+    assert _welcome_panel() is panel
+    assert __version__ in panel.renderable
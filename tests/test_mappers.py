@@ -0,0 +1,42 @@
+"""Tests for mappers module."""
+
+from unittest.mock import patch
+
+import pytest
+
+from config import CustomFieldType
+from mappers import build_custom_field_value, get_confirmation_input
+
+
+def test_build_custom_field_value_text():
+    """Test converting values for text fields."""
+    assert build_custom_field_value(42, CustomFieldType.TEXT) == "42"
+
+
+def test_build_custom_field_value_number():
+    """Test converting values for number fields."""
+    assert build_custom_field_value("3.5", CustomFieldType.NUMBER) == 3.5
+    assert build_custom_field_value("not a number", CustomFieldType.NUMBER) == 0.0
+
+
+def test_build_custom_field_value_checkbox():
+    """Test converting values for checkbox fields."""
+    assert build_custom_field_value(1, CustomFieldType.CHECKBOX) is True
+
+
+@pytest.mark.parametrize(
+    ("description", "expected"),
+    [
+        (None, "N/A"),
+        ("Short description", "Short description"),
+        ("x" * 150, "x" * 100 + "…"),
+    ],
+)
+def test_get_confirmation_input_description_preview(description, expected):
+    """Test that the preview only truncates long descriptions."""
+    with patch("mappers.Table") as mock_table, \
+            patch("mappers.console"), \
+            patch("mappers.Confirm.ask", return_value=True):
+        get_confirmation_input({"name": "Task", "description": description})
+    
+    mock_table.return_value.add_row.assert_any_call("Description", expected)
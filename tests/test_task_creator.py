@@ -1,34 +1,37 @@
 """Tests for task_creator module."""
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from config import ClickUpTaskConfig, EmailContent
-from task_creator import TaskBuilder
+from task_creator import ClickUpTaskCreator, TaskBuilder
 
 
-def test_task_builder_initialization():
-    """Test TaskBuilder initialization."""
-    config = ClickUpTaskConfig(
+@pytest.fixture(scope="module")
+def config():
+    """Shared task configuration for builder tests."""
+    return ClickUpTaskConfig(
         api_key="test_key",
         workspace_name="Test",
         space_name="Test",
         list_name="Test"
     )
-    
+
+
+@pytest.fixture
+def builder(config):
+    """TaskBuilder for the shared configuration."""
+    return TaskBuilder(config)
+
+
+def test_task_builder_initialization(config):
+    """Test TaskBuilder initialization."""
     builder = TaskBuilder(config)
     assert builder.config == config
 
 
-def test_build_task_payload():
+def test_build_task_payload(builder):
     """Test building task payload."""
-    config = ClickUpTaskConfig(
-        api_key="test_key",
-        workspace_name="Test",
-        space_name="Test",
-        list_name="Test"
-    )
-    
     email = EmailContent(
         subject="Test Subject",
         body="Test Body",
@@ -37,38 +40,66 @@ def test_build_task_payload():
         date="2025-01-01"
     )
     
-    builder = TaskBuilder(config)
     payload = builder.build_task_payload(email)
     
     assert payload["name"] == "Test Subject"
     assert "description" in payload
 
 
-def test_validate_payload_valid():
-    """Test validating valid payload."""
-    config = ClickUpTaskConfig(
-        api_key="test_key",
-        workspace_name="Test",
-        space_name="Test",
-        list_name="Test"
+@pytest.fixture(params=["fallback", "jsonschema"])
+def validator(request):
+    """Run validation through the hand-written checks and the JSON Schema."""
+    if request.param == "jsonschema":
+        pytest.importorskip("jsonschema")
+        yield
+    else:
+        with patch("task_creator._TASK_VALIDATOR", None):
+            yield
+
+
+@pytest.mark.parametrize("payload,expected", [
+    ({"name": "Test Task", "description": "Test"}, True),
+    ({"name": "Test Task", "description": None}, True),
+    ({"description": "Test"}, False),
+    ({"name": ""}, False),
+    ({"name": 123}, False),
+    ({"name": "x" * 501}, False),
+])
+def test_validate_payload(builder, validator, payload, expected):
+    """Test that both validation paths accept the same payloads."""
+    assert builder.validate_payload(payload) is expected
+
+
+def test_build_task_payload_truncates_long_body(builder):
+    """Test that long email bodies are truncated for the description."""
+    email = EmailContent(
+        subject="Test Subject",
+        body="x" * 600,
+        sender="Test Sender",
+        sender_email="test@example.com",
+        date="2025-01-01"
     )
     
-    builder = TaskBuilder(config)
-    payload = {"name": "Test Task", "description": "Test"}
+    payload = builder.build_task_payload(email)
     
-    assert builder.validate_payload(payload) is True
+    assert len(payload["description"]) == 500
+    assert payload["markdown_description"] is payload["description"]
 
 
-def test_validate_payload_missing_name():
-    """Test validating payload with missing name."""
+def test_task_creator_defers_api_client():
+    """Test that the API client is created lazily and shared per API key."""
     config = ClickUpTaskConfig(
-        api_key="test_key",
+        api_key="deferred_key",
         workspace_name="Test",
         space_name="Test",
         list_name="Test"
     )
     
-    builder = TaskBuilder(config)
-    payload = {"description": "Test"}
+    with patch("task_creator.get_client") as mock_get_client:
+        creator = ClickUpTaskCreator(config)
+        mock_get_client.assert_not_called()
+        
+        assert creator.api_client is creator.api_client
+        mock_get_client.assert_called_once_with("deferred_key")
     
-    assert builder.validate_payload(payload) is False
+    assert ClickUpTaskCreator(config).api_client is ClickUpTaskCreator(config).api_client